@@ -1,9 +1,47 @@
 # mypy: ignore-errors
+import atexit
 import json
 import os
 import sys
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, TextIO
+
+_INPUTS_LOG = Path("./inputs.log")
+_inputs_log_fh: Optional[TextIO] = None
+
+# Hook response asking Claude Code for the next answer; serialized once
+_BLOCK_RESPONSE = (
+    json.dumps(
+        {
+            "continue": True,
+            "decision": "block",
+            "stopReason": "Enable auto-fix? [y/n]",
+            "suppressOutput": False,
+            "output": "Please provide more information.",
+            "hookSpecificOutput": {
+                "hookEventName": "UserPromptSubmit",
+                "additionalContext": "Add to context",
+            },
+        }
+    )
+    + "\n"
+)
+
+
+@cache
+def _stdin_is_tty() -> bool:
+    """Whether fd 0 is a TTY; it doesn't change for the life of the process"""
+    return os.isatty(0)
+
+
+def _append_inputs_log(line: str) -> None:
+    """Append a line to ./inputs.log through a single buffered handle"""
+    global _inputs_log_fh
+    if _inputs_log_fh is None:
+        _inputs_log_fh = _INPUTS_LOG.open("a", buffering=1 << 16)
+        atexit.register(_inputs_log_fh.flush)
+    _inputs_log_fh.write(line)
 
 
 class HookCompatibleInput:
@@ -22,30 +60,17 @@ class HookCompatibleInput:
         """behaves like input() in tty mode, but is compatible with Claude Code hooks"""
         # Write the received input out to a log file ./inputs.log
         args = sys.argv[1:]
-        log_path = Path("./inputs.log")
-        with log_path.open("a") as f:
-            f.write(
-                f"Prompt ID: {prompt_id}, args: {args}, Prompt: {prompt}, Input: {current_input}\n"
-            )
-        if os.isatty(0):
+        _append_inputs_log(
+            f"Prompt ID: {prompt_id}, args: {args}, Prompt: {prompt}, Input: {current_input}\n"
+        )
+        if _stdin_is_tty():
             # If we're in a TTY, just use the normal input
             return input(prompt)
         if self.last_prompt_id == prompt_id:
             return current_input
         if self.last_prompt_id == prompt_id - 1:
             # If we're not in a TTY, we need to use the Claude Code hooks
-            print(
-                '{"continue": true, '
-                '"decision": "block", '
-                '"stopReason": "Enable auto-fix? [y/n]", '
-                '"suppressOutput": false, '
-                '"output": "Please provide more information.",'
-                '"hookSpecificOutput": {'
-                '"hookEventName": "UserPromptSubmit",'
-                '"additionalContext": "Add to context"}'
-                "}",
-                file=sys.stdout,
-            )
+            sys.stdout.write(_BLOCK_RESPONSE)
         elif self.last_prompt_id < prompt_id - 1:
             match = self.response_by_id.get(prompt_id - 1, {})
             if match:
@@ -69,7 +94,7 @@ def print_stdin_and_tty():
         file=sys.stdout,
     )
     print("STDIN:", os.read(0, 1024).decode("utf-8"))
-    print("Is TTY:", os.isatty(0))
+    print("Is TTY:", _stdin_is_tty())
     svc = HookCompatibleInput(sys.stdin.read())
     is_autofix = svc.input_with_id(1, "Should I auto-fix? [y/n]", "n")
     name = svc.input_with_id(2, "What is your name?", "John Doe")
@@ -89,8 +114,7 @@ def write_stdin_to_file():
     if not txt:
         return
     # Write the input to a file
-    with open("inputs.log", "a") as f:
-        f.write(txt + "\n")
+    _append_inputs_log(txt + "\n")
 
 if __name__ == "__main__":
     # print_stdin_and_tty()
@@ -39,7 +39,7 @@ def main() -> None:
         if config:
             monitor.task = config.get("task", "")
             monitor.requirements = [
-                TaskRequirement(**req) for req in config.get("requirements", [])
+                TaskRequirement.from_dict(req) for req in config.get("requirements", [])
             ]
             monitor.stats = config.get("stats", {})
     elif args.create_test:
@@ -4,8 +4,8 @@ Orchestra CLI - Claude Code Extension Manager
 """
 
 import click
-from rich.console import Console
 
+from orchestra.commands import get_console
 from orchestra.commands.disable import disable
 from orchestra.commands.enable import enable
 from orchestra.commands.hook import hook
@@ -18,8 +18,6 @@ from orchestra.commands.tester import tester
 from orchestra.commands.tidy import tidy
 from orchestra.commands.timemachine import timemachine
 
-console = Console()
-
 
 @click.group(invoke_without_command=True)
 @click.version_option(version="0.7.0", prog_name="Orchestra")
@@ -53,7 +51,7 @@ def main() -> None:
     try:
         cli()
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        get_console().print(f"[bold red]Error:[/bold red] {e}")
         raise
 
 
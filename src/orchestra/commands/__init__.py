@@ -1 +1,20 @@
 """Orchestra CLI commands"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=None)
+def get_console() -> "Console":
+    """Get the shared rich console
+
+    rich is imported on first use, so commands that never print styled
+    output (notably `orchestra hook`, run on every Claude Code hook event)
+    don't pay for importing it.
+    """
+    from rich.console import Console
+
+    return Console()
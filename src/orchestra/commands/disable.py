@@ -1,12 +1,9 @@
 """Disable command for Orchestra CLI"""
 
 import click
-from rich.console import Console
 
 from orchestra.core import Orchestra
 
-console = Console()
-
 
 @click.command()
 @click.argument("extension")
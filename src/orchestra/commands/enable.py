@@ -1,12 +1,10 @@
 """Enable command for Orchestra CLI"""
 
 import click
-from rich.console import Console
 
+from orchestra.commands import get_console
 from orchestra.core import Orchestra
 
-console = Console()
-
 
 @click.command()
 @click.argument("extension", required=False)
@@ -27,11 +25,12 @@ def enable(extension, global_scope):
         orchestra.enable(extension, scope)
     else:
         # Enable all extensions
+        console = get_console()
         console.print(
             "[bold blue]🎼 Enabling all Orchestra extensions...[/bold blue]\n"
         )
 
-        for ext_id in orchestra.extensions.keys():
+        for ext_id in Orchestra.EXTENSIONS:
             console.print(f"\n[bold cyan]📦 Enabling {ext_id}...[/bold cyan]")
             orchestra.enable(ext_id, scope)
 
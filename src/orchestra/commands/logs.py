@@ -6,9 +6,8 @@ import subprocess
 import time
 
 import click
-from rich.console import Console
 
-console = Console()
+from orchestra.commands import get_console
 
 
 def _format_log_line(line: str, no_truncate: bool, verbose: bool = False) -> str:
@@ -118,6 +117,7 @@ def _color_extension_name(extension_name: str, abbrev_name: str) -> str:
 
 def _show_recent_logs(log_files: list[str], no_truncate: bool, verbose: bool = False) -> None:
     """Show recent log lines from all files combined, sorted by timestamp"""
+    console = get_console()
     all_lines = []
 
     # Collect lines from all files with timestamps
@@ -163,6 +163,7 @@ def _show_recent_logs(log_files: list[str], no_truncate: bool, verbose: bool = F
 
 def _stream_logs(log_files: list[str], no_truncate: bool, verbose: bool = False) -> None:
     """Stream log files with color formatting"""
+    console = get_console()
     # Track file positions and handles
     file_handles = {}
     file_positions = {}
@@ -243,6 +244,7 @@ def logs(extension: str, tail: bool, clear: bool, no_truncate: bool, verbose: bo
         orchestra logs --tail       # Follow all logs
         orchestra logs --clear      # Clear all logs
     """
+    console = get_console()
     # Find log files
     log_patterns = []
     if extension:
@@ -5,9 +5,8 @@ import sys
 from pathlib import Path
 
 import click
-from rich.console import Console
 
-console = Console()
+from orchestra.commands import get_console
 
 
 @click.group()
@@ -35,11 +34,11 @@ def run_tester_command(subcommand: str, *args: str) -> None:
             sys.argv = original_argv
             
     except ImportError:
-        console.print(
+        get_console().print(
             "[bold red]❌ Tester not available.[/bold red] Ensure orchestra is properly installed."
         )
     except Exception as e:
-        console.print(f"[bold red]❌ Error running tester command:[/bold red] {e}")
+        get_console().print(f"[bold red]❌ Error running tester command:[/bold red] {e}")
 
 
 @tester.command()
@@ -5,9 +5,8 @@ import sys
 from pathlib import Path
 
 import click
-from rich.console import Console
 
-console = Console()
+from orchestra.commands import get_console
 
 
 @click.group()
@@ -35,11 +34,11 @@ def run_timemachine_command(subcommand: str, *args: str) -> None:
             sys.argv = original_argv
             
     except ImportError:
-        console.print(
+        get_console().print(
             "[bold red]❌ TimeMachine not available.[/bold red] Ensure orchestra is properly installed."
         )
     except Exception as e:
-        console.print(f"[bold red]❌ Error running timemachine command:[/bold red] {e}")
+        get_console().print(f"[bold red]❌ Error running timemachine command:[/bold red] {e}")
 
 
 @timemachine.command(name="list")
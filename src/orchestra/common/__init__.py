@@ -8,6 +8,7 @@ subagent integration, and base extension classes.
 from .base_extension import BaseExtension, GitAwareExtension, HookHandler
 from .claude_invoker import ClaudeInvoker, check_predicate, get_invoker, invoke_claude
 from .core_command import CoreCommand
+from .fs_utils import ensure_dir
 from .git_task_manager import GitTaskManager
 from .log_utils import LogContext, format_hook_context, setup_logger, truncate_value
 from .subagent_runner import SubagentRunner
@@ -25,6 +26,7 @@ __all__ = [
     "SubagentRunner",
     "TaskRequirement",
     "check_predicate",
+    "ensure_dir",
     "format_hook_context",
     "get_invoker",
     "invoke_claude",
@@ -13,7 +13,7 @@ import threading
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from orchestra.common.types import HookInput
 
@@ -22,6 +22,22 @@ from .git_task_manager import GitTaskManager
 from .subagent_runner import SubagentRunner
 from .task_state import GitTaskState
 
+# orjson is an optional speedup for settings and state files; its decode
+# error subclasses json.JSONDecodeError so callers handle both the same way
+try:
+    from orjson import OPT_INDENT_2, OPT_NON_STR_KEYS
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
+
+    def _dump_state(config: Dict[str, Any]) -> bytes:
+        return _orjson_dumps(config, option=OPT_INDENT_2 | OPT_NON_STR_KEYS)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _dump_state(config: Dict[str, Any]) -> bytes:
+        return json.dumps(config, indent=2).encode("utf-8")
+
 
 class SessionStateManager:
     """Manages cross-hook state persistence for Orchestra extensions.
@@ -169,6 +185,10 @@ class SessionStateManager:
 class BaseExtension(ABC):
     """Base class for all Orchestra extensions"""
 
+    # Parsed settings.json per path, keyed by (inode, mtime_ns, size) so edits
+    # made by other processes are picked up without re-parsing unchanged files
+    _settings_cache: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
     def __init__(
         self, config_file: Optional[str] = None, working_dir: Optional[str] = None
     ):
@@ -229,33 +249,63 @@ class BaseExtension(ABC):
         """Load configuration from file"""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file) as f:
-                    return json.load(f)
+                with open(self.config_file, "rb") as f:
+                    return _json_loads(f.read())
             except (OSError, json.JSONDecodeError) as e:
                 print(f"Warning: Failed to load config from {self.config_file}: {e}")
         return {}
 
     def save_config(self, config: Dict[str, Any]) -> None:
         """Save configuration to file (state file)"""
+        # Serialize before opening so a failure can't leave a truncated file,
+        # and swap the new file in so readers never see a partial write
+        # The temp file gets a unique name because concurrent hook processes
+        # may save the same state file at once
+        data = _dump_state(config)
+        config_dir = os.path.dirname(self.config_file)
         try:
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            with open(self.config_file, "w") as f:
-                json.dump(config, f, indent=2)
+            os.makedirs(config_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=config_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self.config_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
         except OSError as e:
             print(f"Error: Failed to save config to {self.config_file}: {e}")
     
     def load_settings(self) -> Dict[str, Any]:
-        """Load shared settings from settings.json"""
-        if os.path.exists(self.settings_file):
-            try:
-                with open(self.settings_file) as f:
-                    return json.load(f)
-            except (OSError, json.JSONDecodeError) as e:
-                print(f"Warning: Failed to load settings from {self.settings_file}: {e}")
-        return {}
+        """Load shared settings from settings.json
+
+        The parsed file is cached until it is replaced or modified. Callers get
+        a shallow copy, so replacing top-level sections does not leak into
+        the cache.
+        """
+        try:
+            st = os.stat(self.settings_file)
+        except OSError:
+            return {}
+
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._settings_cache.get(self.settings_file)
+        if cached is not None and cached[0] == key:
+            return dict(cached[1])
+
+        try:
+            with open(self.settings_file, "rb") as f:
+                settings = _json_loads(f.read())
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: Failed to load settings from {self.settings_file}: {e}")
+            return {}
+
+        self._settings_cache[self.settings_file] = (key, settings)
+        return dict(settings)
     
     def save_settings(self, settings: Dict[str, Any]) -> None:
         """Save shared settings to settings.json"""
+        self._settings_cache.pop(self.settings_file, None)
         try:
             with open(self.settings_file, "w") as f:
                 json.dump(settings, f, indent=2)
@@ -275,7 +325,9 @@ class BaseExtension(ABC):
             extension_name = Path(self.get_default_state_filename()).stem
         
         all_settings = self.load_settings()
-        return all_settings.get(extension_name, {})
+        section = all_settings.get(extension_name, {})
+        # Copy so callers editing their settings don't alter the cached file
+        return dict(section) if isinstance(section, dict) else section
 
     def _get_project_directory(self) -> str:
         """Get project directory with fallback hierarchy
@@ -587,13 +639,18 @@ class GitAwareExtension(BaseExtension):
         )
 
     def check_all_subagents(
-        self, analysis_context: str, include_diff: bool = True
+        self,
+        analysis_context: str,
+        include_diff: bool = True,
+        first_match_only: bool = False,
     ) -> Dict[str, Any]:
         """Check all subagents to see which ones should be invoked
 
         Args:
             analysis_context: Context for analysis
             include_diff: Whether to include git diff
+            first_match_only: Return as soon as one subagent is decisively
+                recommended instead of waiting for every check
 
         Returns:
             Dict with recommendations for each subagent
@@ -608,6 +665,7 @@ class GitAwareExtension(BaseExtension):
             task_state=self._current_task_state,
             analysis_context=analysis_context,
             include_diff=include_diff,
+            first_match_only=first_match_only,
         )
 
     def check_predicate(
@@ -723,7 +781,7 @@ class GitAwareExtension(BaseExtension):
             "working_directory": self.working_dir,
         }
 
-    def get_available_subagents(self) -> Dict[str, str]:
+    def get_available_subagents(self) -> Mapping[str, str]:
         """Get available subagent types and descriptions"""
         return self.subagent_runner.get_available_subagents()
 
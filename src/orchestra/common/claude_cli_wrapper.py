@@ -6,11 +6,18 @@ for external Claude CLI invocations.
 """
 
 import json
+import shutil
 import subprocess
+import threading
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Iterator, List, Literal, Optional, Union, overload
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Union, overload
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 
 class OutputFormat(Enum):
@@ -43,6 +50,9 @@ class ClaudeCLIWrapper:
     def __init__(self, default_model: Optional[str] = None):
         """Initialize wrapper with optional default model"""
         self.default_model = default_model
+        # Resolve the CLI once so each invocation skips the PATH search; if it
+        # isn't found, leave the bare name so the usual not-found error surfaces
+        self.claude_bin = shutil.which("claude") or "claude"
 
     @overload
     def invoke(
@@ -136,7 +146,7 @@ class ClaudeCLIWrapper:
         allowed_tools: Optional[str] = None,
     ) -> List[str]:
         """Build Claude CLI command"""
-        cmd = ["claude"]
+        cmd = [self.claude_bin]
 
         # Add --print for non-interactive mode
         cmd.append("--print")
@@ -228,30 +238,72 @@ class ClaudeCLIWrapper:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,  # Line buffered
+                bufsize=262144,
             )
 
-            # Set timeout alarm
-            start_time = time.time()
+            # Drain stderr on a separate thread so a chatty CLI can't fill the
+            # pipe and stall while we are reading stdout
+            stderr_chunks: List[bytes] = []
+            stderr_reader = None
+            if process.stderr:
+                stderr_pipe = process.stderr
+                stderr_reader = threading.Thread(
+                    target=lambda: stderr_chunks.append(stderr_pipe.read()),
+                    daemon=True,
+                )
+                stderr_reader.start()
 
-            # Stream stdout line by line
-            if process.stdout:
-                for line in process.stdout:
-                    if time.time() - start_time > timeout:
-                        process.terminate()
-                        raise subprocess.TimeoutExpired(cmd, timeout)
+            # Set timeout alarm; terminating the process closes stdout, which
+            # ends the read loop even if the CLI has stopped producing output
+            timed_out = threading.Event()
 
-                    line = line.strip()
-                    if line:
-                        try:
-                            yield json.loads(line)
-                        except json.JSONDecodeError:
-                            # Skip non-JSON lines
-                            continue
+            def on_timeout() -> None:
+                timed_out.set()
+                process.terminate()
+
+            timer = threading.Timer(timeout, on_timeout)
+            timer.daemon = True
+            timer.start()
+
+            try:
+                # Read stdout in whatever chunks the pipe delivers and split lines
+                # ourselves, parsing the raw bytes directly
+                if process.stdout:
+                    buf = bytearray()
+                    while chunk := process.stdout.read1(65536):
+                        buf += chunk
+                        while (nl := buf.find(b"\n")) != -1:
+                            line = bytes(buf[:nl])
+                            del buf[: nl + 1]
+                            yield from self._parse_stream_line(line)
+
+                    if timed_out.is_set():
+                        raise subprocess.TimeoutExpired(cmd, timeout)
 
-            # Wait for process to complete
-            process.wait()
+                    # Output may not end with a newline
+                    yield from self._parse_stream_line(bytes(buf))
+
+                # Wait for process to complete
+                returncode = process.wait()
+                if returncode:
+                    if stderr_reader is not None:
+                        stderr_reader.join()
+                    error_msg = f"Claude CLI failed with exit code {returncode}"
+                    stderr = b"".join(stderr_chunks).decode("utf-8", "replace")
+                    if stderr:
+                        error_msg += f"\nStderr: {stderr}"
+                    yield {
+                        "type": "error",
+                        "error": error_msg,
+                        "exit_code": returncode,
+                    }
+            finally:
+                timer.cancel()
+                # The consumer may stop reading early, e.g. once it has the
+                # answer it needs; don't leave the CLI running behind it
+                if process.poll() is None:
+                    process.terminate()
+                    process.wait()
 
         except subprocess.TimeoutExpired:
             yield {
@@ -269,95 +321,114 @@ class ClaudeCLIWrapper:
                 "error": f"Unexpected error: {e!s}",
             }
 
+    def _parse_stream_line(self, line: bytes) -> Iterator[Dict[str, Any]]:
+        """Parse one stream-json line, skipping blank and non-JSON lines"""
+        line = line.strip()
+        if line:
+            try:
+                yield _json_loads(line)
+            except json.JSONDecodeError:
+                pass
+
     def _parse_response(
         self, output: str, output_format: OutputFormat, duration_ms: int
     ) -> ClaudeResponse:
         """Parse Claude CLI output based on format"""
-        if output_format == OutputFormat.TEXT:
+        parser = _PARSERS.get(output_format)
+        if parser is None:
             return ClaudeResponse(
-                success=True,
-                content=output.strip(),
+                success=False,
+                error=f"Unknown output format: {output_format}",
                 duration_ms=duration_ms,
             )
+        return parser(output, duration_ms)
 
-        if output_format == OutputFormat.JSON:
-            try:
-                data = json.loads(output.strip())
 
-                # Extract content from different possible locations
-                content = data.get("content") or data.get("result")
+def _parse_text(output: str, duration_ms: int) -> ClaudeResponse:
+    """Parse text-format Claude CLI output"""
+    return ClaudeResponse(
+        success=True,
+        content=output.strip(),
+        duration_ms=duration_ms,
+    )
 
-                # Extract model info
-                model = data.get("model")
 
-                # Extract usage info
-                usage = data.get("usage")
+def _parse_json(output: str, duration_ms: int) -> ClaudeResponse:
+    """Parse json-format Claude CLI output"""
+    try:
+        data = _json_loads(output)
 
-                return ClaudeResponse(
-                    success=True,
-                    content=content,
-                    messages=[data] if "type" in data else None,
-                    model=model,
-                    usage=usage,
-                    duration_ms=duration_ms,
-                )
-            except json.JSONDecodeError:
-                return ClaudeResponse(
-                    success=False,
-                    error="Failed to parse JSON output",
-                    content=output,
-                    duration_ms=duration_ms,
-                )
+        # Extract content from different possible locations
+        content = data.get("content") or data.get("result")
 
-        elif output_format == OutputFormat.STREAM_JSON:
-            # Parse stream JSON format
-            messages = []
-            content_parts = []
-            model = None
-            usage = None
-
-            for line in output.strip().split("\n"):
-                if line.strip():
-                    try:
-                        obj = json.loads(line)
-                        messages.append(obj)
-
-                        # Extract relevant information
-                        if obj.get("type") == "assistant" and "message" in obj:
-                            msg = obj["message"]
-                            if "content" in msg:
-                                for content in msg["content"]:
-                                    if content.get("type") == "text":
-                                        content_parts.append(content["text"])
-                            if "model" in msg:
-                                model = msg["model"]
-                            if "usage" in msg:
-                                usage = msg["usage"]
-
-                        elif obj.get("type") == "result":
-                            if "result" in obj:
-                                content_parts = [obj["result"]]
-                            if "usage" in obj:
-                                usage = obj["usage"]
-
-                    except json.JSONDecodeError:
-                        continue
+        # Extract model info
+        model = data.get("model")
 
-            return ClaudeResponse(
-                success=True,
-                content="\n".join(content_parts) if content_parts else None,
-                messages=messages,
-                model=model,
-                usage=usage,
-                duration_ms=duration_ms,
-            )
+        # Extract usage info
+        usage = data.get("usage")
 
-        else:
-            return ClaudeResponse(
-                success=False,
-                error=f"Unknown output format: {output_format}",
-                duration_ms=duration_ms,
+        return ClaudeResponse(
+            success=True,
+            content=content,
+            messages=[data] if "type" in data else None,
+            model=model,
+            usage=usage,
+            duration_ms=duration_ms,
+        )
+    except json.JSONDecodeError:
+        return ClaudeResponse(
+            success=False,
+            error="Failed to parse JSON output",
+            content=output,
+            duration_ms=duration_ms,
+        )
+
+
+def _parse_stream_json(output: str, duration_ms: int) -> ClaudeResponse:
+    """Parse stream-json-format Claude CLI output"""
+    messages = []
+    content_parts = []
+    model = None
+    usage = None
+
+    for line in output.splitlines():
+        try:
+            obj = _json_loads(line)
+        except json.JSONDecodeError:
+            # Blank or non-JSON line
+            continue
+        messages.append(obj)
+
+        # Extract relevant information
+        obj_type = obj.get("type")
+        msg = obj.get("message")
+        if obj_type == "assistant" and msg is not None:
+            content_parts.extend(
+                c["text"] for c in msg.get("content", ()) if c.get("type") == "text"
             )
+            model = msg.get("model", model)
+            usage = msg.get("usage", usage)
+
+        elif obj_type == "result":
+            if "result" in obj:
+                content_parts = [obj["result"]]
+            usage = obj.get("usage", usage)
+
+    return ClaudeResponse(
+        success=True,
+        content="\n".join(content_parts) if content_parts else None,
+        messages=messages,
+        model=model,
+        usage=usage,
+        duration_ms=duration_ms,
+    )
+
+
+_PARSERS: Dict[OutputFormat, Callable[[str, int], ClaudeResponse]] = {
+    OutputFormat.TEXT: _parse_text,
+    OutputFormat.JSON: _parse_json,
+    OutputFormat.STREAM_JSON: _parse_stream_json,
+}
 
 
 # Convenience function
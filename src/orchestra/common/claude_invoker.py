@@ -47,6 +47,7 @@ class ClaudeInvoker:
         max_tokens: Optional[int] = None,
         include_git_diff: bool = False,
         allowed_tools: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Invoke Claude with the given prompt and configuration
 
@@ -59,6 +60,8 @@ class ClaudeInvoker:
             max_tokens: Maximum tokens in response
             include_git_diff: Whether to include current git diff in context
             allowed_tools: Space-separated list of allowed tools (e.g., "Bash(git:*) Edit")
+            env: Extra environment variables for the Claude process, layered
+                over os.environ without modifying it
 
         Returns:
             Response dict with 'success', 'response', and other metadata
@@ -100,14 +103,15 @@ class ClaudeInvoker:
             if system_prompt:
                 options.system_prompt = system_prompt
 
+            # Set environment variable to prevent recursive calls. It is passed to
+            # the Claude process only, so concurrent invocations don't race on
+            # os.environ
+            options.env = {**(env or {}), "ORCHESTRA_CLAUDE_INVOCATION": "1"}
+
             # Override settings to disable all hooks for external Claude instances
             # This prevents the external Claude from also having tidy extensions applied
             options.settings = temp_settings_path
 
-            # Set environment variable to prevent recursive calls
-            original_env = os.environ.get("ORCHESTRA_CLAUDE_INVOCATION")
-            os.environ["ORCHESTRA_CLAUDE_INVOCATION"] = "1"
-
             try:
                 # Use the ClaudeSDKClient for better control
                 import asyncio
@@ -157,12 +161,6 @@ class ClaudeInvoker:
                         raise
 
             finally:
-                # Clean up environment variable
-                if original_env is None:
-                    os.environ.pop("ORCHESTRA_CLAUDE_INVOCATION", None)
-                else:
-                    os.environ["ORCHESTRA_CLAUDE_INVOCATION"] = original_env
-
                 # Clean up temporary settings file
                 try:
                     os.unlink(temp_settings_path)
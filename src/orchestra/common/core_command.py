@@ -5,14 +5,23 @@ Provides a base class for all extension commands that use external Claude instan
 with minimal context for focused, single-purpose analysis.
 """
 
+import hashlib
 import json
 import logging
+import os
+import re
 import subprocess
+import tempfile
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
 
 from .claude_cli_wrapper import ClaudeCLIWrapper, ClaudeResponse, OutputFormat
 
+# JSON between ```json and ``` fences in a response
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+
 
 class CoreCommand(ABC):
     """Base class for all extension core commands
@@ -22,15 +31,29 @@ class CoreCommand(ABC):
     one monolithic instance.
     """
 
-    def __init__(self, model: str = "haiku", logger: Optional[logging.Logger] = None):
+    # Cached results older than this are ignored and re-computed
+    CACHE_TTL_SECONDS = 3600
+    # Least recently used results are evicted beyond this many entries
+    CACHE_MAX_ENTRIES = 256
+
+    def __init__(
+        self,
+        model: str = "haiku",
+        logger: Optional[logging.Logger] = None,
+        cache_dir: Optional[str] = None,
+    ):
         """Initialize command with Claude wrapper
 
         Args:
             model: Claude model to use (default: haiku for speed)
             logger: Optional logger instance
+            cache_dir: Directory for memoized results of identical prompts,
+                e.g. .claude/orchestra/cache. Caching is off when None or
+                when ORCHESTRA_CACHE=0
         """
         self.claude = ClaudeCLIWrapper(default_model=model)
         self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.cache_dir = cache_dir
 
     @abstractmethod
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
@@ -107,6 +130,13 @@ class CoreCommand(ABC):
             self.logger.error(f"Error building prompts: {e}")
             return {"success": False, "error": f"Failed to build prompts: {e!s}"}
 
+        cache_file = self._cache_file(prompt, system_prompt)
+        if cache_file is not None:
+            cached = self._load_cached_result(cache_file)
+            if cached is not None:
+                self.logger.debug(f"Using cached result: {cache_file.name}")
+                return cached
+
         self.logger.debug(f"Calling Claude with prompt: {prompt[:200]}...")
         self.logger.debug(f"System prompt: {system_prompt[:100]}...")
 
@@ -118,7 +148,10 @@ class CoreCommand(ABC):
                 output_format=OutputFormat.STREAM_JSON,
                 timeout=120,  # 2 minutes default
                 verbose=True,
+                stream=True,
             )
+            if not isinstance(response, ClaudeResponse):
+                response = self._collect_streamed_response(response)
         except subprocess.TimeoutExpired as e:
             self.logger.error(f"Claude invocation timed out after {e.timeout} seconds")
             return {
@@ -138,7 +171,6 @@ class CoreCommand(ABC):
         try:
             result = self.parse_response(response)
             result["success"] = True
-            return result
         except Exception as e:
             self.logger.error(f"Error parsing response: {e}")
             return {
@@ -147,6 +179,133 @@ class CoreCommand(ABC):
                 "raw_response": response.content,
             }
 
+        if cache_file is not None:
+            self._store_cached_result(cache_file, result)
+        return result
+
+    def _collect_streamed_response(
+        self, events: Iterator[Dict[str, Any]]
+    ) -> ClaudeResponse:
+        """Gather assistant text from stream-json events into a response
+
+        Reading stops as soon as the first JSON object in the text is
+        complete, the only thing parse_response looks for; closing the stream
+        terminates the Claude process instead of waiting for it to exit.
+        """
+        content_parts = []
+        text = ""
+        model = None
+        usage = None
+        decoder = json.JSONDecoder()
+
+        try:
+            for event in events:
+                event_type = event.get("type")
+                if event_type == "error":
+                    return ClaudeResponse(
+                        success=False,
+                        error=event.get("error"),
+                        exit_code=event.get("exit_code"),
+                    )
+
+                msg = event.get("message")
+                if event_type == "assistant" and msg is not None:
+                    new_parts = [
+                        c["text"]
+                        for c in msg.get("content", ())
+                        if c.get("type") == "text"
+                    ]
+                    model = msg.get("model", model)
+                    usage = msg.get("usage", usage)
+                    if not new_parts:
+                        continue
+                    content_parts.extend(new_parts)
+                    text = "\n".join(content_parts)
+
+                    # Only the object opened by the first brace counts: an
+                    # inner object of a still-open answer closes before it.
+                    # It can only have closed in text with a new "}"
+                    start_idx = text.find("{")
+                    if start_idx != -1 and any("}" in part for part in new_parts):
+                        try:
+                            result, _ = decoder.raw_decode(text, start_idx)
+                        except json.JSONDecodeError:
+                            pass
+                        else:
+                            if isinstance(result, dict):
+                                return ClaudeResponse(
+                                    success=True,
+                                    content=text,
+                                    model=model,
+                                    usage=usage,
+                                )
+
+                elif event_type == "result":
+                    if "result" in event:
+                        text = event["result"]
+                    usage = event.get("usage", usage)
+        finally:
+            close = getattr(events, "close", None)
+            if close is not None:
+                close()
+
+        if not text:
+            return ClaudeResponse(success=False, error="Claude returned no output")
+        return ClaudeResponse(success=True, content=text, model=model, usage=usage)
+
+    def _cache_key(self, prompt: str, system_prompt: str) -> str:
+        """Hash everything that determines Claude's input into a cache key"""
+        material = "\x1f".join(
+            (self.claude.default_model or "", prompt, system_prompt)
+        )
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_file(self, prompt: str, system_prompt: str) -> Optional[Path]:
+        """Get the cache file for a prompt pair, or None if caching is off"""
+        if not self.cache_dir or os.environ.get("ORCHESTRA_CACHE") == "0":
+            return None
+        return Path(self.cache_dir) / f"{self._cache_key(prompt, system_prompt)}.json"
+
+    def _load_cached_result(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Load a cached result if it exists and hasn't expired
+
+        A hit refreshes the file's mtime, which orders entries for eviction.
+        """
+        try:
+            with open(cache_file, "rb") as f:
+                entry = json.loads(f.read())
+            if time.time() - entry["created"] > self.CACHE_TTL_SECONDS:
+                return None
+            os.utime(cache_file)
+            return entry["result"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store_cached_result(self, cache_file: Path, result: Dict[str, Any]) -> None:
+        """Atomically write a successful result and evict the oldest entries"""
+        # Parse fallbacks report success with an "error" key; never replay those
+        if not result.get("success") or "error" in result:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            data = json.dumps({"created": time.time(), "result": result})
+            fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(data)
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            entries = list(cache_file.parent.glob("*.json"))
+            if len(entries) > self.CACHE_MAX_ENTRIES:
+                entries.sort(key=lambda p: p.stat().st_mtime)
+                for stale in entries[: len(entries) - self.CACHE_MAX_ENTRIES]:
+                    stale.unlink(missing_ok=True)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not cache result: {e}")
+
     def extract_json_from_response(self, content: str) -> Dict[str, Any]:
         """Helper to extract JSON from Claude's response
 
@@ -169,46 +328,30 @@ class CoreCommand(ABC):
         except json.JSONDecodeError:
             pass
 
-        # Look for JSON block in response
-        import re
+        # Every JSON object needs a brace; skip the searches below without one
+        if "{" not in content:
+            raise json.JSONDecodeError("No valid JSON found in response", content, 0)
 
         # Try to find JSON between ```json and ```
-        json_match = re.search(r"```json\s*(.*?)\s*```", content, re.DOTALL)
+        json_match = _JSON_FENCE_RE.search(content)
         if json_match:
             result = json.loads(json_match.group(1))
             return result if isinstance(result, dict) else {}
 
-        # Try to find raw JSON object (handle nested objects)
-        # Look for balanced braces
+        # Try to find raw JSON object (handle nested objects). raw_decode
+        # parses from each candidate brace in C and stops at the end of the
+        # first complete value, ignoring any prose after it
+        decoder = json.JSONDecoder()
         start_idx = content.find("{")
-        if start_idx != -1:
-            brace_count = 0
-            in_string = False
-            escape = False
-
-            for i, char in enumerate(content[start_idx:], start_idx):
-                if escape:
-                    escape = False
-                    continue
-
-                if char == "\\":
-                    escape = True
-                    continue
-
-                if char == '"' and not escape:
-                    in_string = not in_string
-                    continue
-
-                if not in_string:
-                    if char == "{":
-                        brace_count += 1
-                    elif char == "}":
-                        brace_count -= 1
-                        if brace_count == 0:
-                            # Found complete JSON object
-                            json_str = content[start_idx : i + 1]
-                            result = json.loads(json_str)
-                            return result if isinstance(result, dict) else {}
+        while start_idx != -1:
+            try:
+                result, _ = decoder.raw_decode(content, start_idx)
+            except json.JSONDecodeError:
+                pass
+            else:
+                if isinstance(result, dict):
+                    return result
+            start_idx = content.find("{", start_idx + 1)
 
         # If all else fails, raise the error
         raise json.JSONDecodeError("No valid JSON found in response", content, 0)
@@ -0,0 +1,25 @@
+"""
+Filesystem utilities for Orchestra extensions
+
+Hook handlers run once per tool call, so avoid repeating filesystem checks
+whose answer does not change within a process.
+"""
+
+import os
+from typing import Set, Union
+
+_ready_dirs: Set[str] = set()
+
+
+def ensure_dir(path: Union[str, "os.PathLike[str]"]) -> None:
+    """Create a directory unless it was already seen in this process
+
+    Args:
+        path: Directory to create, including missing parents
+    """
+    path = os.fspath(path)
+    if path in _ready_dirs:
+        return
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+    _ready_dirs.add(path)
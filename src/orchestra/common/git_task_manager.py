@@ -25,6 +25,8 @@ class GitTaskManager:
         """
         self.working_dir = working_dir or os.getcwd()
         self.branch_prefix = "task-monitor"
+        # Once confirmed, a working dir stays a repo for this manager's lifetime
+        self._is_repo_confirmed = False
 
     def _run_git_command(self, args: List[str]) -> subprocess.CompletedProcess[str]:
         """Run git command in working directory"""
@@ -94,8 +96,11 @@ class GitTaskManager:
 
     def _is_git_repo(self) -> bool:
         """Check if current directory is a git repository"""
+        if self._is_repo_confirmed:
+            return True
         try:
             self._run_git_command(["rev-parse", "--git-dir"])
+            self._is_repo_confirmed = True
             return True
         except subprocess.CalledProcessError:
             return False
@@ -5,14 +5,111 @@ Provides git-aware subagent invocation with automatic context creation and branc
 """
 
 import os
+import queue
+import shutil
 import subprocess
-from typing import Any, Dict, List
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from .claude_invoker import check_predicate, invoke_claude
 from .git_task_manager import GitTaskManager
 from .task_state import GitTaskState
 
 
+@lru_cache(maxsize=4)
+def _claude_cli_available(claude_bin: Optional[str]) -> bool:
+    """Check whether the resolved Claude CLI binary runs
+
+    Keyed on the resolved binary path so installing or moving the CLI is
+    picked up without re-running the check on every call.
+    """
+    if claude_bin is None:
+        return False
+    try:
+        result = subprocess.run(
+            [claude_bin, "--version"], check=False, capture_output=True, timeout=5
+        )
+        return result.returncode == 0
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return False
+
+
+# Static prompt text, filled in per invocation
+_ANALYSIS_PROMPT_TEMPLATE = """You are a {subagent_type} subagent analyzing a development session.
+
+**Your Role**: {description}
+
+**Current Task**: {task_description}
+
+**Git Context**:
+- Analysis Branch: {branch_name}
+- Files Changed: {file_count} files
+- Changed Files: {changed_files}
+
+**Session Context**:
+{analysis_context}
+
+**Git Diff of Changes**:
+```diff
+{diff_output}
+```
+
+**Analysis Instructions**:
+1. Review the task description and current changes
+2. Identify any deviations from the core task requirements
+3. Consider whether the work is progressing toward the stated goal
+4. Flag any concerning patterns or unnecessary complexity
+
+**Response Format**:
+Provide a clear assessment with specific recommendations. If you detect issues, explain:
+- What specific deviation you identified
+- Why it's problematic for the current task
+- What should be done instead
+
+If the work appears aligned with the task, confirm this and suggest next steps.
+"""
+
+_PREDICATE_QUESTIONS = {
+    "scope-creep-detector": "Is the current work adding features or improvements beyond the core requirements of the task: {task_description}?",
+    "over-engineering-detector": "Is the current work introducing unnecessary complexity or architectural patterns before completing basic functionality for the task: {task_description}?",
+    "off-topic-detector": "Is the current work unrelated to the task: {task_description}?",
+}
+_DEFAULT_PREDICATE_QUESTION = (
+    "Should the {subagent_type} subagent be invoked for this task?"
+)
+
+
+# Cap how much git context is embedded in each analysis prompt
+MAX_PROMPT_FILES = 50
+MAX_PROMPT_DIFF_CHARS = 50_000
+
+# Confidence at which check_all_subagents(first_match_only=True) stops early
+DECISIVE_MATCH_CONFIDENCE = 0.9
+
+
+def _summarize_files(changed_files: List[str]) -> str:
+    """Join changed file names for a prompt, listing at most MAX_PROMPT_FILES"""
+    if not changed_files:
+        return "None"
+    summary = ", ".join(changed_files[:MAX_PROMPT_FILES])
+    if len(changed_files) > MAX_PROMPT_FILES:
+        summary += f", ...and {len(changed_files) - MAX_PROMPT_FILES} more"
+    return summary
+
+
+def _truncate_diff(diff_output: str) -> str:
+    """Trim a diff for a prompt to at most MAX_PROMPT_DIFF_CHARS"""
+    if not diff_output.strip():
+        return "No changes detected"
+    if len(diff_output) <= MAX_PROMPT_DIFF_CHARS:
+        return diff_output
+    omitted = len(diff_output) - MAX_PROMPT_DIFF_CHARS
+    return f"{diff_output[:MAX_PROMPT_DIFF_CHARS]}\n... [diff truncated, {omitted} more characters]"
+
+
 class SubagentRunner:
     """Manages subagent invocation with git context integration"""
 
@@ -28,6 +125,7 @@ class SubagentRunner:
             "over-engineering-detector": "Identifies when commands introduce unnecessary complexity, abstractions, or architectural patterns before basic functionality is complete",
             "off-topic-detector": "Identifies when commands are unrelated to the current task objectives and requirements",
         }
+        self._subagent_types_view = MappingProxyType(self.subagent_types)
 
     def is_claude_code_environment(self) -> bool:
         """Check if running inside Claude Code environment"""
@@ -39,6 +137,8 @@ class SubagentRunner:
         task_state: GitTaskState,
         analysis_context: str,
         create_branch: bool = True,
+        diff_output: Optional[str] = None,
+        changed_files: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Invoke a subagent with git context
 
@@ -47,50 +147,92 @@ class SubagentRunner:
             task_state: Current task state with git information
             analysis_context: Context for subagent analysis
             create_branch: Whether to create a dedicated branch for subagent
+            diff_output: Task diff, if the caller already has it
+            changed_files: Task file changes, if the caller already has them
 
         Returns:
             Subagent response or error information
         """
         if subagent_type not in self.subagent_types:
-            return {
-                "error": f"Unknown subagent type: {subagent_type}",
-                "available_types": list(self.subagent_types.keys()),
-            }
+            return self._unknown_subagent_error(subagent_type)
 
         try:
-            # Create subagent branch if requested
-            if create_branch:
-                subagent_branch = self.git_manager.create_subagent_branch(
-                    task_state, subagent_type
+            # Get git diff for context. This runs before the subagent branch is
+            # checked out, so diff the task branch rather than whatever HEAD is
+            if diff_output is None:
+                diff_output = self.git_manager.get_task_diff(
+                    task_state, task_state.branch_name
+                )
+            if changed_files is None:
+                changed_files = self.git_manager.get_task_file_changes(
+                    task_state, task_state.branch_name
                 )
-            else:
-                subagent_branch = task_state.branch_name
-
-            # Get git diff for context
-            diff_output = self.git_manager.get_task_diff(task_state)
-            changed_files = self.git_manager.get_task_file_changes(task_state)
-
-            # Build analysis prompt with git context
-            prompt = self._build_analysis_prompt(
-                subagent_type=subagent_type,
-                task_description=task_state.task_description,
-                diff_output=diff_output,
-                changed_files=changed_files,
-                analysis_context=analysis_context,
-                branch_name=subagent_branch,
-            )
 
-            if self.is_claude_code_environment():
-                # Running inside Claude Code - return structured response
-                return self._invoke_claude_code_subagent(subagent_type, prompt)
-            # Running externally - call external Claude instance
-            return self._invoke_external_claude(prompt, subagent_type)
+            prompt = self._prepare_subagent_prompt(
+                subagent_type,
+                task_state,
+                analysis_context,
+                create_branch,
+                diff_output,
+                changed_files,
+            )
+            return self._dispatch_subagent(subagent_type, prompt)
 
         except Exception as e:
-            return {
-                "error": f"Failed to invoke subagent: {e!s}",
-                "subagent_type": subagent_type,
-            }
+            return self._subagent_failure(subagent_type, e)
+
+    def _unknown_subagent_error(self, subagent_type: str) -> Dict[str, Any]:
+        """Build the error response for an unknown subagent type"""
+        return {
+            "error": f"Unknown subagent type: {subagent_type}",
+            "available_types": list(self.subagent_types.keys()),
+        }
+
+    def _subagent_failure(self, subagent_type: str, error: Exception) -> Dict[str, Any]:
+        """Build the error response for a subagent that failed to run"""
+        return {
+            "error": f"Failed to invoke subagent: {error!s}",
+            "subagent_type": subagent_type,
+        }
+
+    def _prepare_subagent_prompt(
+        self,
+        subagent_type: str,
+        task_state: GitTaskState,
+        analysis_context: str,
+        create_branch: bool,
+        diff_output: str,
+        changed_files: List[str],
+    ) -> str:
+        """Set up the subagent branch and build its analysis prompt
+
+        Creating a branch checks it out, so this must not run concurrently.
+        """
+        # Create subagent branch if requested
+        if create_branch:
+            subagent_branch = self.git_manager.create_subagent_branch(
+                task_state, subagent_type
+            )
+        else:
+            subagent_branch = task_state.branch_name
+
+        # Build analysis prompt with git context
+        return self._build_analysis_prompt(
+            subagent_type=subagent_type,
+            task_description=task_state.task_description,
+            diff_output=diff_output,
+            changed_files=changed_files,
+            analysis_context=analysis_context,
+            branch_name=subagent_branch,
+        )
+
+    def _dispatch_subagent(self, subagent_type: str, prompt: str) -> Dict[str, Any]:
+        """Hand a prepared prompt to Claude Code or an external Claude instance"""
+        if self.is_claude_code_environment():
+            # Running inside Claude Code - return structured response
+            return self._invoke_claude_code_subagent(subagent_type, prompt)
+        # Running externally - call external Claude instance
+        return self._invoke_external_claude(prompt, subagent_type)
 
     def _build_analysis_prompt(
         self,
@@ -105,42 +247,18 @@ class SubagentRunner:
 
         # Get subagent description
         description = self.subagent_types.get(subagent_type, subagent_type)
-
-        prompt = f"""You are a {subagent_type} subagent analyzing a development session.
-
-**Your Role**: {description}
-
-**Current Task**: {task_description}
-
-**Git Context**:
-- Analysis Branch: {branch_name}
-- Files Changed: {len(changed_files)} files
-- Changed Files: {', '.join(changed_files) if changed_files else 'None'}
-
-**Session Context**:
-{analysis_context}
-
-**Git Diff of Changes**:
-```diff
-{diff_output if diff_output.strip() else 'No changes detected'}
-```
-
-**Analysis Instructions**:
-1. Review the task description and current changes
-2. Identify any deviations from the core task requirements
-3. Consider whether the work is progressing toward the stated goal
-4. Flag any concerning patterns or unnecessary complexity
-
-**Response Format**:
-Provide a clear assessment with specific recommendations. If you detect issues, explain:
-- What specific deviation you identified
-- Why it's problematic for the current task
-- What should be done instead
-
-If the work appears aligned with the task, confirm this and suggest next steps.
-"""
-
-        return prompt
+        return _ANALYSIS_PROMPT_TEMPLATE.format_map(
+            {
+                "subagent_type": subagent_type,
+                "description": description,
+                "task_description": task_description,
+                "branch_name": branch_name,
+                "file_count": len(changed_files),
+                "changed_files": _summarize_files(changed_files),
+                "analysis_context": analysis_context,
+                "diff_output": _truncate_diff(diff_output),
+            }
+        )
 
     def _invoke_claude_code_subagent(
         self, subagent_type: str, prompt: str
@@ -192,16 +310,63 @@ If the work appears aligned with the task, confirm this and suggest next steps.
         Returns:
             Combined responses from all subagents
         """
-        results = {}
+        results: Dict[str, Dict[str, Any]] = {}
+        prompts: Dict[str, str] = {}
 
-        for subagent_type in subagent_types:
-            result = self.invoke_subagent(
-                subagent_type=subagent_type,
-                task_state=task_state,
-                analysis_context=analysis_context,
-                create_branch=True,
+        # Subagent branches all start from the task branch, so the diff is the
+        # same for every subagent; fetch it once, against that branch
+        try:
+            diff_output = self.git_manager.get_task_diff(
+                task_state, task_state.branch_name
+            )
+            changed_files = self.git_manager.get_task_file_changes(
+                task_state, task_state.branch_name
+            )
+        except Exception as e:
+            return self._combine_results(
+                {st: self._subagent_failure(st, e) for st in subagent_types},
+                subagent_types,
             )
-            results[subagent_type] = result
+
+        # Branch setup checks out git branches, so prepare prompts one at a time
+        for subagent_type in subagent_types:
+            if subagent_type not in self.subagent_types:
+                results[subagent_type] = self._unknown_subagent_error(subagent_type)
+                continue
+            try:
+                prompts[subagent_type] = self._prepare_subagent_prompt(
+                    subagent_type,
+                    task_state,
+                    analysis_context,
+                    True,
+                    diff_output,
+                    changed_files,
+                )
+            except Exception as e:
+                results[subagent_type] = self._subagent_failure(subagent_type, e)
+
+        # The Claude round-trips are independent, so run them concurrently
+        if prompts:
+            with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+                futures = {
+                    executor.submit(self._dispatch_subagent, subagent_type, prompt): subagent_type
+                    for subagent_type, prompt in prompts.items()
+                }
+                for future in as_completed(futures):
+                    subagent_type = futures[future]
+                    try:
+                        results[subagent_type] = future.result()
+                    except Exception as e:
+                        results[subagent_type] = self._subagent_failure(subagent_type, e)
+
+        return self._combine_results(results, subagent_types)
+
+    def _combine_results(
+        self, results: Dict[str, Dict[str, Any]], subagent_types: List[str]
+    ) -> Dict[str, Any]:
+        """Summarize per-subagent results from invoke_multiple_subagents"""
+        # Report results in the order they were requested
+        results = {subagent_type: results[subagent_type] for subagent_type in subagent_types}
 
         # Analyze combined results
         has_errors = any("error" in result for result in results.values())
@@ -229,38 +394,32 @@ If the work appears aligned with the task, confirm this and suggest next steps.
         if len(analyses) == 1:
             return analyses[0]
 
-        combined = "**Combined Subagent Analysis**:\n\n"
-
-        for i, analysis in enumerate(analyses, 1):
-            combined += f"**Analysis {i}**:\n{analysis}\n\n"
-
-        combined += "**Summary**: Multiple subagents have provided analysis above. Review each perspective to understand the full context."
+        parts = ["**Combined Subagent Analysis**:\n\n"]
+        parts.extend(
+            f"**Analysis {i}**:\n{analysis}\n\n"
+            for i, analysis in enumerate(analyses, 1)
+        )
+        parts.append(
+            "**Summary**: Multiple subagents have provided analysis above. Review each perspective to understand the full context."
+        )
 
-        return combined
+        return "".join(parts)
 
-    def get_available_subagents(self) -> Dict[str, str]:
-        """Get list of available subagent types and their descriptions"""
-        return self.subagent_types.copy()
+    def get_available_subagents(self) -> Mapping[str, str]:
+        """Get available subagent types and descriptions as a read-only view"""
+        return self._subagent_types_view
 
     def validate_subagent_environment(self) -> Dict[str, Any]:
         """Validate that the environment is properly set up for subagent invocation"""
         validation = {
             "claude_code_detected": self.is_claude_code_environment(),
             "git_repo": self.git_manager._is_git_repo(),
-            "claude_cli_available": False,
+            # Check if Claude CLI is available for external invocation
+            "claude_cli_available": _claude_cli_available(shutil.which("claude")),
             "working_directory": self.git_manager.working_dir,
             "issues": [],
         }
 
-        # Check if Claude CLI is available for external invocation
-        try:
-            result = subprocess.run(
-                ["claude", "--version"], check=False, capture_output=True, timeout=5
-            )
-            validation["claude_cli_available"] = result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            validation["claude_cli_available"] = False
-
         # Identify issues
         if not validation["git_repo"]:
             validation["issues"].append("Not in a git repository")
@@ -281,6 +440,7 @@ If the work appears aligned with the task, confirm this and suggest next steps.
         task_state: GitTaskState,
         analysis_context: str,
         include_diff: bool = True,
+        changed_files: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Check if a subagent should be invoked using predicate system
 
@@ -289,6 +449,7 @@ If the work appears aligned with the task, confirm this and suggest next steps.
             task_state: Current task state
             analysis_context: Context for analysis
             include_diff: Whether to include git diff in predicate check
+            changed_files: Task file changes, if the caller already has them
 
         Returns:
             Dict with 'should_invoke' (bool), 'reasoning', and other metadata
@@ -301,15 +462,10 @@ If the work appears aligned with the task, confirm this and suggest next steps.
             }
 
         # Build predicate question based on subagent type
-        questions = {
-            "scope-creep-detector": f"Is the current work adding features or improvements beyond the core requirements of the task: {task_state.task_description}?",
-            "over-engineering-detector": f"Is the current work introducing unnecessary complexity or architectural patterns before completing basic functionality for the task: {task_state.task_description}?",
-            "off-topic-detector": f"Is the current work unrelated to the task: {task_state.task_description}?",
-        }
-
-        question = questions.get(
-            subagent_type,
-            f"Should the {subagent_type} subagent be invoked for this task?",
+        question = _PREDICATE_QUESTIONS.get(
+            subagent_type, _DEFAULT_PREDICATE_QUESTION
+        ).format(
+            task_description=task_state.task_description, subagent_type=subagent_type
         )
 
         # Prepare context
@@ -321,7 +477,8 @@ If the work appears aligned with the task, confirm this and suggest next steps.
 
         # Add file change summary if available
         if include_diff:
-            changed_files = self.git_manager.get_task_file_changes(task_state)
+            if changed_files is None:
+                changed_files = self.git_manager.get_task_file_changes(task_state)
             if changed_files:
                 context["files_changed"] = changed_files
                 context["change_count"] = len(changed_files)
@@ -335,17 +492,18 @@ If the work appears aligned with the task, confirm this and suggest next steps.
         )
 
         # Format response
+        definitive = result.get("definitive", False)
         response = {
             "should_invoke": result.get("answer", False),
             "confidence": result.get("confidence", 0.0),
             "reasoning": result.get("reasoning", ""),
             "subagent_type": subagent_type,
             "question_asked": question,
-            "definitive": result.get("definitive", False),
+            "definitive": definitive,
         }
 
         # If not definitive, add suggestion but still use the answer
-        if not result.get("definitive", False):
+        if not definitive:
             response["suggestion"] = (
                 "Confidence too low for automatic decision. Consider manual review."
             )
@@ -353,7 +511,11 @@ If the work appears aligned with the task, confirm this and suggest next steps.
         return response
 
     def check_all_subagents(
-        self, task_state: GitTaskState, analysis_context: str, include_diff: bool = True
+        self,
+        task_state: GitTaskState,
+        analysis_context: str,
+        include_diff: bool = True,
+        first_match_only: bool = False,
     ) -> Dict[str, Any]:
         """Check all subagents to see which ones should be invoked
 
@@ -361,21 +523,55 @@ If the work appears aligned with the task, confirm this and suggest next steps.
             task_state: Current task state
             analysis_context: Context for analysis
             include_diff: Whether to include git diff
+            first_match_only: Stop waiting for the remaining checks once one
+                subagent is recommended with a definitive, high-confidence answer
 
         Returns:
-            Dict with results for each subagent type
+            Dict with results for each subagent type that was checked
         """
+        # The file list is the same for every subagent; fetch it once
+        changed_files = (
+            self.git_manager.get_task_file_changes(task_state) if include_diff else None
+        )
+
+        # Each predicate is an independent Claude round-trip; check them
+        # concurrently. Daemon threads, so checks abandoned by an early exit
+        # never hold up interpreter shutdown
+        outcomes: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+
+        def run_check(subagent_type: str) -> None:
+            try:
+                outcome: Any = self.should_invoke_subagent(
+                    subagent_type=subagent_type,
+                    task_state=task_state,
+                    analysis_context=analysis_context,
+                    include_diff=include_diff,
+                    changed_files=changed_files,
+                )
+            except Exception as e:
+                outcome = e
+            outcomes.put((subagent_type, outcome))
+
+        for subagent_type in self.subagent_types:
+            threading.Thread(target=run_check, args=(subagent_type,), daemon=True).start()
+
+        completed: Dict[str, Dict[str, Any]] = {}
+        for _ in self.subagent_types:
+            subagent_type, outcome = outcomes.get()
+            if isinstance(outcome, Exception):
+                raise outcome
+            completed[subagent_type] = outcome
+            if first_match_only and self._is_decisive_match(outcome):
+                break
+
         results = {}
         recommended_subagents = []
 
+        # Report results in declaration order
         for subagent_type in self.subagent_types:
-            check_result = self.should_invoke_subagent(
-                subagent_type=subagent_type,
-                task_state=task_state,
-                analysis_context=analysis_context,
-                include_diff=include_diff,
-            )
-
+            if subagent_type not in completed:
+                continue
+            check_result = completed[subagent_type]
             results[subagent_type] = check_result
 
             if check_result.get("should_invoke"):
@@ -393,3 +589,11 @@ If the work appears aligned with the task, confirm this and suggest next steps.
             "recommendation_count": len(recommended_subagents),
             "has_recommendations": len(recommended_subagents) > 0,
         }
+
+    def _is_decisive_match(self, check_result: Dict[str, Any]) -> bool:
+        """Whether a predicate result is confident enough to skip the others"""
+        return bool(
+            check_result.get("should_invoke")
+            and check_result.get("definitive")
+            and check_result.get("confidence", 0.0) >= DECISIVE_MATCH_CONFIDENCE
+        )
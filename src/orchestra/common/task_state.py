@@ -67,7 +67,7 @@ class GitTaskState:
         return cls.from_dict(data)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskRequirement:
     """Individual task requirement - kept for backward compatibility"""
 
@@ -20,13 +20,13 @@ class UserPreferenceCache:
         :param default: Value to return if key not found
         :return: Preference value or default
         """
-        if key not in self._cache:
+        # Move to end to mark as recently used; a miss raises without a
+        # separate membership check
+        try:
+            self._cache.move_to_end(key)
+        except KeyError:
             return default
-
-        # Move to end to mark as recently used
-        value = self._cache[key]
-        self._cache.move_to_end(key)
-        return value
+        return self._cache[key]
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -35,12 +35,9 @@ class UserPreferenceCache:
         :param key: Preference key
         :param value: Preference value
         """
-        # Remove if key exists to update its position
-        if key in self._cache:
-            del self._cache[key]
-
-        # Add new item
+        # Store and mark as most recently used (new keys are already last)
         self._cache[key] = value
+        self._cache.move_to_end(key)
 
         # Evict oldest item if over limit
         if len(self._cache) > self._max_size:
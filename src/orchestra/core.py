@@ -4,23 +4,133 @@ Orchestra Core - Extension management with template support
 
 import json
 import shutil
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Set
 
 from jinja2 import Environment, FileSystemLoader
-from rich.console import Console
-from rich.table import Table
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# orjson is an optional speedup for reading and writing settings.json; its
+# decode error subclasses json.JSONDecodeError so callers handle both the same way
+try:
+    from orjson import OPT_INDENT_2
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
+
+    def _dump_settings(settings: Dict[str, Any]) -> bytes:
+        return _orjson_dumps(settings, option=OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _dump_settings(settings: Dict[str, Any]) -> bytes:
+        return json.dumps(settings, indent=2).encode("utf-8")
 
 
 class Orchestra:
     """Orchestra extension manager using template-based configuration"""
 
+    # Available extensions registry
+    EXTENSIONS: Dict[str, Dict[str, Any]] = {
+        "task": {
+            "name": "Task Monitor",
+            "description": "Keep Claude focused on your task requirements. Prevents scope creep, tracks progress, and guides you through requirements step by step.",
+            "commands": [
+                "task progress",
+                "focus",
+            ],
+            "features": [
+                "Blocks off-topic commands",
+                "Warns about scope creep",
+                "Tracks progress automatically",
+                "Guides through requirements",
+            ],
+            "monitor_script": "task_monitor.py",
+        },
+        "timemachine": {
+            "name": "TimeMachine",
+            "description": "Automatic git checkpointing for every conversation turn. Travel back in time to any previous state with full prompt history.",
+            "commands": [
+                "timemachine list",
+                "timemachine checkout",
+                "timemachine view",
+                "timemachine rollback",
+            ],
+            "features": [
+                "Checkpoint every user prompt",
+                "View conversation history",
+                "Rollback to any previous state",
+                "Track file modifications per turn",
+            ],
+            "monitor_script": "timemachine_monitor.py",
+        },
+        "tidy": {
+            "name": "Tidy",
+            "description": "Automated code quality checker that ensures code meets project standards. Runs linters, formatters, and type checkers after Claude modifies files.",
+            "commands": [
+                "tidy init",
+                "tidy check",
+                "tidy fix",
+                "tidy status",
+                "tidy learn",
+            ],
+            "features": [
+                "Auto-detects project type and tools",
+                "Runs checks after code modifications",
+                "Parallel execution for performance",
+                "Learns project conventions over time",
+                "Supports Python, JS/TS, Rust, and more",
+            ],
+            "monitor_script": "tidy_monitor.py",
+            "extra_modules": ["project_detector.py", "tool_runners.py"],
+        },
+        "tester": {
+            "name": "Tester",
+            "description": "Automatically test completed tasks using calibrated testing methods. Learns your project's testing approach through interactive calibration.",
+            "commands": ["tester calibrate", "tester test", "tester status"],
+            "features": [
+                "Interactive calibration to learn test methods",
+                "Automatic test execution on task completion",
+                "Browser testing with Chrome automation",
+                "Smart test selection based on changes",
+            ],
+            "monitor_script": "tester_monitor.py",
+        },
+        "plancheck": {
+            "name": "Plancheck",
+            "description": "Monitors ExitPlanMode tool usage and blocks for plan review. Saves plans to organized files and creates plan-specific checkpoints via TimeMachine integration.",
+            "commands": ["plancheck status"],
+            "features": [
+                "Detects ExitPlanMode tool usage",
+                "Blocks for plancheck agent review",
+                "Saves plans to .claude/orchestra/plans/",
+                "Creates plan-specific checkpoints",
+            ],
+            "monitor_script": "plancheck_monitor.py",
+        },
+        "neveragain": {
+            "name": "Never Again",
+            "description": "Learns from user corrections to prevent repeated mistakes. Analyzes transcripts for user corrections and stores them as instructions.",
+            "commands": ["neveragain status", "neveragain view"],
+            "features": [
+                "Analyzes conversation transcripts for corrections",
+                "Learns from user feedback automatically",
+                "Stores lessons in .claude/memory/neveragain.md",
+                "Prevents repeated mistakes over time",
+            ],
+            "monitor_script": "neveragain_monitor.py",
+        },
+    }
+
     def __init__(self) -> None:
         self.__version__ = "0.8.0"
-        self.home = Path.home()
-        self.global_dir = self.home / ".claude" / "commands"
         self.local_dir = Path(".claude") / "commands"
-        self.console = Console()
+        # Directories already created by this instance; enabling several
+        # extensions keeps asking for the same ones
+        self._ready_dirs: Set[Path] = set()
 
         # Set up Jinja2 environment
         template_dir = Path(__file__).parent / "templates"
@@ -30,97 +140,30 @@ class Orchestra:
             lstrip_blocks=True,
         )
 
-        # Available extensions registry
-        self.extensions = {
-            "task": {
-                "name": "Task Monitor",
-                "description": "Keep Claude focused on your task requirements. Prevents scope creep, tracks progress, and guides you through requirements step by step.",
-                "commands": [
-                    "task progress",
-                    "focus",
-                ],
-                "features": [
-                    "Blocks off-topic commands",
-                    "Warns about scope creep",
-                    "Tracks progress automatically",
-                    "Guides through requirements",
-                ],
-                "monitor_script": "task_monitor.py",
-            },
-            "timemachine": {
-                "name": "TimeMachine",
-                "description": "Automatic git checkpointing for every conversation turn. Travel back in time to any previous state with full prompt history.",
-                "commands": [
-                    "timemachine list",
-                    "timemachine checkout",
-                    "timemachine view",
-                    "timemachine rollback",
-                ],
-                "features": [
-                    "Checkpoint every user prompt",
-                    "View conversation history",
-                    "Rollback to any previous state",
-                    "Track file modifications per turn",
-                ],
-                "monitor_script": "timemachine_monitor.py",
-            },
-            "tidy": {
-                "name": "Tidy",
-                "description": "Automated code quality checker that ensures code meets project standards. Runs linters, formatters, and type checkers after Claude modifies files.",
-                "commands": [
-                    "tidy init",
-                    "tidy check",
-                    "tidy fix",
-                    "tidy status",
-                    "tidy learn",
-                ],
-                "features": [
-                    "Auto-detects project type and tools",
-                    "Runs checks after code modifications",
-                    "Parallel execution for performance",
-                    "Learns project conventions over time",
-                    "Supports Python, JS/TS, Rust, and more",
-                ],
-                "monitor_script": "tidy_monitor.py",
-                "extra_modules": ["project_detector.py", "tool_runners.py"],
-            },
-            "tester": {
-                "name": "Tester",
-                "description": "Automatically test completed tasks using calibrated testing methods. Learns your project's testing approach through interactive calibration.",
-                "commands": ["tester calibrate", "tester test", "tester status"],
-                "features": [
-                    "Interactive calibration to learn test methods",
-                    "Automatic test execution on task completion",
-                    "Browser testing with Chrome automation",
-                    "Smart test selection based on changes",
-                ],
-                "monitor_script": "tester_monitor.py",
-            },
-            "plancheck": {
-                "name": "Plancheck",
-                "description": "Monitors ExitPlanMode tool usage and blocks for plan review. Saves plans to organized files and creates plan-specific checkpoints via TimeMachine integration.",
-                "commands": ["plancheck status"],
-                "features": [
-                    "Detects ExitPlanMode tool usage",
-                    "Blocks for plancheck agent review",
-                    "Saves plans to .claude/orchestra/plans/",
-                    "Creates plan-specific checkpoints",
-                ],
-                "monitor_script": "plancheck_monitor.py",
-            },
-            "neveragain": {
-                "name": "Never Again",
-                "description": "Learns from user corrections to prevent repeated mistakes. Analyzes transcripts for user corrections and stores them as instructions.",
-                "commands": ["neveragain status", "neveragain view"],
-                "features": [
-                    "Analyzes conversation transcripts for corrections",
-                    "Learns from user feedback automatically",
-                    "Stores lessons in .claude/memory/neveragain.md",
-                    "Prevents repeated mistakes over time",
-                ],
-                "monitor_script": "neveragain_monitor.py",
-            },
-        }
+    @cached_property
+    def console(self) -> "Console":
+        """Rich console, importing rich only once something is printed"""
+        from rich.console import Console
+
+        return Console()
+
+    @cached_property
+    def home(self) -> Path:
+        """User home directory, looked up only by commands that use it"""
+        return Path.home()
+
+    @cached_property
+    def global_dir(self) -> Path:
+        """Global commands directory"""
+        return self.home / ".claude" / "commands"
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory and its parents unless already done here"""
+        if path in self._ready_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        self._ready_dirs.add(path)
+        self._ready_dirs.update(path.parents)
 
     def render_template(self, template_name: str, context: Dict[str, Any]) -> str:
         """Render a Jinja2 template with the given context"""
@@ -129,12 +172,12 @@ class Orchestra:
 
     def enable(self, extension: str, scope: str = "project") -> None:
         """Enable an Orchestra extension"""
-        if extension not in self.extensions:
+        if extension not in self.EXTENSIONS:
             self.console.print(
                 f"[bold red]❌ Unknown extension:[/bold red] {extension}"
             )
             self.console.print("[yellow]Available extensions:[/yellow]")
-            for ext_id, ext_info in self.extensions.items():
+            for ext_id, ext_info in self.EXTENSIONS.items():
                 self.console.print(f"  • {ext_id} - {ext_info['name']}")
             return
 
@@ -161,9 +204,9 @@ class Orchestra:
             scripts_dir = Path(".claude") / "orchestra" / extension
 
         # Create commands directory (for command files)
-        commands_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(commands_dir)
         # Create bootstrap directory but not individual extension dirs
-        scripts_dir.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(scripts_dir.parent)
 
         # Create shell bootstrap script using template
         bootstrap_dest = scripts_dir.parent / "bootstrap.sh"
@@ -174,7 +217,7 @@ class Orchestra:
         )
 
         # Get extension info
-        ext_info = self.extensions[extension]
+        ext_info = self.EXTENSIONS[extension]
         monitor_script = ext_info.get("monitor_script", f"{extension}_monitor.py")
 
         # Context for bootstrap template
@@ -184,9 +227,17 @@ class Orchestra:
             "global_script_path": f"$HOME/.claude/orchestra/{extension}/{monitor_script}",
         }
 
-        bootstrap_content = self.render_template("bootstrap.sh.j2", bootstrap_context)
-        with open(bootstrap_dest, "w") as f:
-            f.write(bootstrap_content)
+        # The script is shared by all extensions, so enabling several in a row
+        # renders the same bytes; only rewrite it when it actually changed
+        bootstrap_content = self.render_template(
+            "bootstrap.sh.j2", bootstrap_context
+        ).encode("utf-8")
+        try:
+            bootstrap_current = bootstrap_dest.read_bytes() == bootstrap_content
+        except OSError:
+            bootstrap_current = False
+        if not bootstrap_current:
+            bootstrap_dest.write_bytes(bootstrap_content)
         bootstrap_dest.chmod(0o755)
 
         # No longer copying extension files - use global installation
@@ -208,7 +259,7 @@ class Orchestra:
 
     def _copy_extension_files(self, extension: str, scripts_dir: Path) -> None:
         """Copy extension files to the scripts directory"""
-        ext_info = self.extensions[extension]
+        ext_info = self.EXTENSIONS[extension]
         monitor_script = ext_info.get("monitor_script")
 
         if not monitor_script or not isinstance(monitor_script, str):
@@ -266,7 +317,7 @@ class Orchestra:
     def _create_task_commands(self, commands_dir: Path, bootstrap_path: str) -> None:
         """Create task extension commands"""
         task_dir = commands_dir / "task"
-        task_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(task_dir)
 
         commands = {
             "progress": {
@@ -301,7 +352,7 @@ class Orchestra:
     ) -> None:
         """Create timemachine extension commands"""
         tm_dir = commands_dir / "timemachine"
-        tm_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(tm_dir)
 
         commands = {
             "list": {
@@ -336,7 +387,7 @@ class Orchestra:
     def _create_tidy_commands(self, commands_dir: Path, bootstrap_path: str) -> None:
         """Create tidy extension commands"""
         tidy_dir = commands_dir / "tidy"
-        tidy_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(tidy_dir)
 
         commands = {
             "init": {
@@ -375,7 +426,7 @@ class Orchestra:
     def _create_tester_commands(self, commands_dir: Path, bootstrap_path: str) -> None:
         """Create tester extension commands"""
         tester_dir = commands_dir / "tester"
-        tester_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(tester_dir)
 
         commands = {
             "calibrate": {
@@ -414,8 +465,9 @@ class Orchestra:
         settings_file = commands_dir.parent / "settings.json"
         if settings_file.exists():
             try:
-                with open(settings_file) as f:
-                    existing_settings: Dict[str, Any] = json.load(f)
+                existing_settings: Dict[str, Any] = _json_loads(
+                    settings_file.read_bytes()
+                )
             except json.JSONDecodeError:
                 # If the file has comments or is invalid JSON, create a backup and start fresh
                 import shutil
@@ -441,8 +493,7 @@ class Orchestra:
         else:
             existing_settings["hooks"] = hooks_config["hooks"]
 
-        with open(settings_file, "w") as f:
-            json.dump(existing_settings, f, indent=2)
+        settings_file.write_bytes(_dump_settings(existing_settings))
 
     def _install_subagents(self, extension: str, scope: str) -> None:
         """Install subagents for an extension"""
@@ -455,7 +506,7 @@ class Orchestra:
         else:
             agents_dir = Path(".claude") / "agents"
 
-        agents_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(agents_dir)
 
         # Copy subagent templates
         source_agents_dir = Path(__file__).parent / "extensions" / extension / "agents"
@@ -549,7 +600,7 @@ class Orchestra:
                 self.console.print()
 
         self.console.print("[bold yellow]Available to enable:[/bold yellow]")
-        for ext_id, ext_info in self.extensions.items():
+        for ext_id, ext_info in self.EXTENSIONS.items():
             # Check if already installed
             local_installed = (self.local_dir / ext_id).exists()
             global_installed = (self.global_dir / ext_id).exists()
@@ -563,6 +614,8 @@ class Orchestra:
         """Show detailed status of all extensions"""
         self.console.print("[bold blue]🎼 Orchestra Extension Status[/bold blue]\n")
 
+        from rich.table import Table
+
         # Create status table
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Extension", style="cyan", width=16)
@@ -570,7 +623,7 @@ class Orchestra:
         table.add_column("Details", style="dim", width=50)
 
         # Check each extension
-        for ext_id, ext_info in self.extensions.items():
+        for ext_id, ext_info in self.EXTENSIONS.items():
             # Check installation scope - look for both commands and scripts
             local_commands_installed = (self.local_dir / ext_id).exists()
             global_commands_installed = (self.global_dir / ext_id).exists()
@@ -713,6 +766,8 @@ class Orchestra:
 
     def disable(self, extension: str, scope: str = "global") -> None:
         """Disable an extension"""
+        # Directories may be removed below; don't trust earlier mkdirs
+        self._ready_dirs.clear()
         if scope == "global":
             commands_dir = self.global_dir
             scripts_dir = self.home / ".claude" / "orchestra" / extension
@@ -838,8 +893,7 @@ class Orchestra:
             return
 
         try:
-            with open(settings_file) as f:
-                settings = json.load(f)
+            settings = _json_loads(settings_file.read_bytes())
 
             if "hooks" in settings:
                 # Remove Orchestra-specific hooks
@@ -876,8 +930,7 @@ class Orchestra:
                     del settings["hooks"]
 
             # Write back the cleaned settings
-            with open(settings_file, "w") as f:
-                json.dump(settings, f, indent=2)
+            settings_file.write_bytes(_dump_settings(settings))
 
         except Exception as e:
             self.console.print(
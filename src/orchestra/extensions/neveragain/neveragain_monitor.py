@@ -6,24 +6,39 @@ Learns from user corrections to prevent repeated mistakes.
 Analyzes transcripts for user corrections and stores them as instructions.
 """
 
+import io
 import json
 import logging
+import mmap
 import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 # Import from common library
 from orchestra.common import (
     BaseExtension,
     HookHandler,
+    ensure_dir,
     format_hook_context,
     setup_logger,
 )
 from orchestra.common.types import HookInput
 from orchestra.common.claude_invoker import invoke_claude
 
+# orjson is an optional speedup for transcript parsing; its decode error
+# subclasses json.JSONDecodeError so callers handle both the same way
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+MEMORY_FILE_HEADER = "# Must Follow Guidelines\n\nNo code shall violate the guidelines below. You MUST follow these guidelines at all times:\n\n"
+
+# Keys a transcript record needs before it is considered a message
+_MESSAGE_FIELDS = frozenset(("type", "role", "content"))
+
 
 class NeverAgainMonitor(BaseExtension):
     """Extension that learns from user corrections to prevent repeated mistakes"""
@@ -34,7 +49,7 @@ class NeverAgainMonitor(BaseExtension):
 
         # Set up logging
         log_dir = os.path.join(working_dir, ".claude", "logs")
-        os.makedirs(log_dir, exist_ok=True)
+        ensure_dir(log_dir)
         log_file = os.path.join(log_dir, "neveragain_monitor.log")
 
         # Configure logger
@@ -48,7 +63,7 @@ class NeverAgainMonitor(BaseExtension):
 
         # Set up memory directory
         self.memory_dir = Path(working_dir) / ".claude" / "memory"
-        self.memory_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.memory_dir)
         self.memory_file = self.memory_dir / "neveragain.md"
 
         # State: track last processed position in transcript
@@ -96,8 +111,13 @@ class NeverAgainMonitor(BaseExtension):
                 return HookHandler.create_allow_response()
 
             # Parse transcript for new messages since last processing
+            previous_position = self.last_processed_position
             new_messages = self._parse_new_messages(transcript_path)
 
+            # Persist the new position once, and only if it moved
+            if self.last_processed_position != previous_position:
+                self.save_config()
+
             if not new_messages:
                 self.logger.debug("No new messages to process")
                 return HookHandler.create_allow_response()
@@ -124,53 +144,58 @@ class NeverAgainMonitor(BaseExtension):
     def _parse_new_messages(self, transcript_path: str) -> List[Dict[str, Any]]:
         """Parse transcript and get new messages since last processing"""
         try:
-            with open(transcript_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            size = os.stat(transcript_path).st_size
+            if size < self.last_processed_position:
+                # Transcript was truncated or replaced; start over
+                self.logger.info("Transcript shrank, resetting processed position")
+                self.last_processed_position = 0
+            if size <= self.last_processed_position:
+                self.logger.debug("Transcript has not grown since last pass")
+                return []
 
-            # Find messages after last processed position
             new_messages = []
-            current_position = 0
-            current_message = None
-
-            for line in lines:
-                current_position += len(line)
+            position = self.last_processed_position
 
-                # Skip lines before last processed position
-                if current_position <= self.last_processed_position:
-                    continue
+            for raw in self._iter_new_lines(transcript_path):
+                position += len(raw)
 
-                line = line.strip()
+                line = raw.strip()
                 if not line:
                     continue
 
                 # Try to parse as JSONL
                 try:
-                    data = json.loads(line)
-                    if data.get("type") == "message":
-                        role = data.get("role")
-                        content = data.get("content", "")
-
-                        if role and content:
+                    data = _json_loads(line)
+                    if (
+                        isinstance(data, dict)
+                        and _MESSAGE_FIELDS <= data.keys()
+                        and data["type"] == "message"
+                    ):
+                        role = data["role"]
+                        content = data["content"]
+
+                        if isinstance(role, str) and role and content:
+                            # Roles repeat on every line; share one string object
                             new_messages.append({
-                                "role": role,
+                                "role": sys.intern(role),
                                 "content": content,
                                 "timestamp": data.get("timestamp", "")
                             })
-                except json.JSONDecodeError:
+                except (json.JSONDecodeError, UnicodeDecodeError):
                     # Handle plain text format as fallback
+                    line = line.decode("utf-8", "replace")
                     if line.startswith("user: ") or line.startswith("assistant: "):
                         parts = line.split(": ", 1)
                         if len(parts) == 2:
                             role, content = parts
                             new_messages.append({
-                                "role": role,
+                                "role": sys.intern(role),
                                 "content": content,
                                 "timestamp": datetime.now().isoformat()
                             })
 
-            # Update last processed position
-            self.last_processed_position = current_position
-            self.save_config()
+            # Update last processed position (persisted by the caller)
+            self.last_processed_position = position
 
             self.logger.info(f"Found {len(new_messages)} new messages")
             return new_messages
@@ -179,20 +204,32 @@ class NeverAgainMonitor(BaseExtension):
             self.logger.error(f"Error parsing transcript: {e}")
             return []
 
+    def _iter_new_lines(self, transcript_path: str) -> Iterator[bytes]:
+        """Yield complete transcript lines written since the last processed position
+
+        The caller must have checked the transcript is larger than that position.
+        """
+        with open(transcript_path, "rb") as f:
+            # Map the file and resume from the saved byte offset, so neither the
+            # already processed prefix nor a full copy of the file is read
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                mm.seek(self.last_processed_position)
+                for raw in iter(mm.readline, b""):
+                    # Leave a partially written trailing line for the next pass
+                    if not raw.endswith(b"\n"):
+                        return
+                    yield raw
+
     def _analyze_corrections_async(self, messages: List[Dict[str, Any]]) -> bool:
-        """Analyze messages for corrections and update memory (async)"""
+        """Analyze messages for corrections and update memory"""
         if not messages:
             return False
 
         try:
             # Build conversation context
-            conversation = []
-            for msg in messages:
-                role = msg["role"]
-                content = msg["content"]
-                conversation.append(f"{role}: {content}")
-
-            conversation_text = "\n\n".join(conversation)
+            conversation_text = "\n\n".join(
+                f"{msg['role']}: {msg['content']}" for msg in messages
+            )
 
             # Create analysis prompt
             prompt = f"""Analyze the following conversation transcript and identify instances where the user is correcting the assistant regarding a mistake made by the assistant.
@@ -227,35 +264,26 @@ Remember: Output ONLY the guidelines in the exact format shown, nothing else."""
             # Invoke Claude to analyze the corrections
             self.logger.info("Invoking Claude to analyze user corrections")
 
-            # Set ORCH_PROJECT_DIR to preserve our project context in environment
-            # This will be inherited by any subprocess calls
-            original_orch_dir = os.environ.get("ORCH_PROJECT_DIR")
-            os.environ["ORCH_PROJECT_DIR"] = self.working_dir
-
-            try:
-                response_data = invoke_claude(prompt=prompt)
-
-                # Extract response text from the response data
-                response_text = ""
-                if isinstance(response_data, dict):
-                    response_text = response_data.get("response", "") or response_data.get("content", "")
-                else:
-                    response_text = str(response_data)
-
-                if response_text and response_text.strip() != "NO_CORRECTIONS_FOUND":
-                    self._update_memory_file(response_text.strip())
-                    self.logger.info("Updated memory with new corrections")
-                    return True
-                else:
-                    self.logger.debug("No corrections found in recent messages")
-                    return False
-
-            finally:
-                # Restore original ORCH_PROJECT_DIR
-                if original_orch_dir is not None:
-                    os.environ["ORCH_PROJECT_DIR"] = original_orch_dir
-                else:
-                    os.environ.pop("ORCH_PROJECT_DIR", None)
+            # Pass ORCH_PROJECT_DIR to the Claude process to preserve our project
+            # context, without mutating os.environ for the whole process
+            response_data = invoke_claude(
+                prompt=prompt, env={"ORCH_PROJECT_DIR": self.working_dir}
+            )
+
+            # Extract response text from the response data
+            response_text = ""
+            if isinstance(response_data, dict):
+                response_text = response_data.get("response", "") or response_data.get("content", "")
+            else:
+                response_text = str(response_data)
+
+            if response_text and response_text.strip() != "NO_CORRECTIONS_FOUND":
+                self._update_memory_file(response_text.strip())
+                self.logger.info("Updated memory with new corrections")
+                return True
+            else:
+                self.logger.debug("No corrections found in recent messages")
+                return False
 
         except Exception as e:
             self.logger.error(f"Error analyzing corrections: {e}")
@@ -266,21 +294,16 @@ Remember: Output ONLY the guidelines in the exact format shown, nothing else."""
     def _update_memory_file(self, corrections: str) -> None:
         """Update the neveragain.md memory file with new corrections"""
         try:
-            # Read existing content
-            existing_content = ""
-            if self.memory_file.exists():
-                existing_content = self.memory_file.read_text(encoding='utf-8')
-
-            # Create header if file is new
-            if not existing_content.strip():
-                existing_content = "# Must Follow Guidelines\n\nNo code shall violate the guidelines below. You MUST follow these guidelines at all times:\n\n"
-
-            # Add new corrections without timestamp
-            new_entry = f"\n{corrections}\n"
-
-            # Write updated content
-            updated_content = existing_content + new_entry
-            self.memory_file.write_text(updated_content, encoding='utf-8')
+            # An explicit buffer size stops open() probing isatty() on the file
+            with self.memory_file.open(
+                'a', encoding='utf-8', buffering=io.DEFAULT_BUFFER_SIZE
+            ) as f:
+                # Create header if file is new or empty
+                if f.tell() == 0:
+                    f.write(MEMORY_FILE_HEADER)
+
+                # Append new corrections without timestamp
+                f.write(f"\n{corrections}\n")
 
             self.logger.info(f"Updated {self.memory_file} with new corrections")
 
@@ -8,9 +8,9 @@ Communicates with TimeMachine extension via session state for checkpoint creatio
 import json
 import logging
 import os
-import re
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -18,11 +18,32 @@ from typing import Any, Dict, Optional
 from orchestra.common import (
     BaseExtension,
     HookHandler,
+    ensure_dir,
     format_hook_context,
     setup_logger,
     truncate_value,
 )
 
+# orjson is an optional speedup for decoding the hook payload
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Translation table deleting characters not allowed in plan file names
+_FILENAME_DELETE_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
+# How many leading plan lines to search for a title
+_TITLE_SCAN_LINES = 32
+
+
+@lru_cache(maxsize=None)
+def _log_file_for(working_dir: str) -> str:
+    """Path of the plancheck log for a project, creating its directory"""
+    log_dir = os.path.join(working_dir, ".claude", "logs")
+    ensure_dir(log_dir)
+    return os.path.join(log_dir, "plancheck.log")
+
 
 class PlancheckMonitor(BaseExtension):
     def __init__(self, config_path: Optional[str] = None) -> None:
@@ -31,10 +52,7 @@ class PlancheckMonitor(BaseExtension):
         if not working_dir:
             working_dir = self._get_project_directory()
 
-        log_dir = os.path.join(working_dir, ".claude", "logs")
-
-        os.makedirs(log_dir, exist_ok=True)
-        log_file = os.path.join(log_dir, "plancheck.log")
+        log_file = _log_file_for(working_dir)
 
         # Configure logger with truncation
         self.logger = setup_logger(
@@ -49,13 +67,11 @@ class PlancheckMonitor(BaseExtension):
             working_dir=base_working_dir,
         )
 
-        # Ensure settings exist with defaults
-        self._ensure_settings_exist()
-
         # Plancheck specific state
         self.enabled: bool = True
         self.settings: Dict[str, Any] = {}
         self.plans_saved: int = 0  # Counter for plans saved
+        self.plans_dir = Path(self.orchestra_dir) / "plans"
 
         self.load_config()
 
@@ -63,34 +79,23 @@ class PlancheckMonitor(BaseExtension):
         """Get the default configuration file name for this extension"""
         return "plancheck.json"
 
-    def _ensure_settings_exist(self) -> None:
-        """Ensure extension settings exist with defaults"""
-        settings = self.load_settings()
-        if not settings.get("plancheck"):
-            # Create default settings for plancheck
-            default_plancheck_settings = {
-                "enabled": True,
-                "plans_directory": "plans",
-                "auto_save": True
-            }
-            settings["plancheck"] = default_plancheck_settings
-            self.save_settings(settings)
-            self.logger.info("Created default plancheck settings")
-
     def load_config(self) -> Dict[str, Any]:
         """Load state and settings"""
         # Load state from the state file (dot-prefixed)
         state = super().load_config()
 
-        # Load settings from shared settings.json
-        self.settings = self.get_extension_settings("plancheck")
+        # Load settings from shared settings.json, writing defaults on first run
+        all_settings = self.load_settings()
+        self.settings = all_settings.get("plancheck") or {}
         if not self.settings:
-            # Default settings if not found in settings.json
             self.settings = {
                 "enabled": True,
-                "save_plans": True,
-                "auto_review": True
+                "plans_directory": "plans",
+                "auto_save": True
             }
+            all_settings["plancheck"] = self.settings
+            self.save_settings(all_settings)
+            self.logger.info("Created default plancheck settings")
 
         # Load state data
         self.enabled = state.get("enabled", self.settings.get("enabled", True))
@@ -111,16 +116,18 @@ class PlancheckMonitor(BaseExtension):
 
     def handle_hook(self, hook_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Universal hook handler"""
-        self.logger.info(f"Handling hook: {hook_type}")
-        self.logger.debug(f"Hook context: {format_hook_context(context)}")
-
         if not self.enabled:
             return HookHandler.create_allow_response()
 
-        if hook_type == "PostToolUse":
-            return self._handle_post_tool_use_hook(context)
+        # Only ExitPlanMode is of interest; let every other event through
+        # before doing any logging work
+        if hook_type != "PostToolUse" or context.get("tool_name") != "ExitPlanMode":
+            return HookHandler.create_allow_response()
+
+        self.logger.info("Handling hook: %s", hook_type)
+        self.logger.debug("Hook context: %s", format_hook_context(context))
 
-        return HookHandler.create_allow_response()
+        return self._handle_post_tool_use_hook(context)
 
     def _handle_post_tool_use_hook(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle PostToolUse hook by detecting ExitPlanMode tool usage"""
@@ -130,8 +137,11 @@ class PlancheckMonitor(BaseExtension):
             self.logger.info("ExitPlanMode tool detected - processing plan")
 
             try:
+                # One timestamp for the plan file and the session state
+                now = datetime.now()
+
                 # 1. Save plan to file
-                plan_file_path = self._save_plan_to_file(context)
+                plan_file_path = self._save_plan_to_file(context, now)
 
                 # Extract title from the file path for session state
                 plan_title = Path(plan_file_path).stem.split('_', 1)[-1] if plan_file_path else "plan"
@@ -140,12 +150,12 @@ class PlancheckMonitor(BaseExtension):
                 self.update_session_state(context, {
                     "plan_active": True,
                     "plan_title": plan_title,
-                    "plan_timestamp": datetime.now().isoformat()
+                    "plan_timestamp": now.isoformat()
                 })
 
                 # 3. Block with plancheck agent review request
                 reason = f"ask the plancheck agent to review the current plan and decide if it needs more work. The plan has been saved to: {plan_file_path} - update it if there are revisions needed."
-                self.logger.info(f"Blocking ExitPlanMode for review: {reason}")
+                self.logger.info("Blocking ExitPlanMode for review: %s", reason)
 
                 return {
                     "block": True,
@@ -153,19 +163,20 @@ class PlancheckMonitor(BaseExtension):
                 }
 
             except Exception as e:
-                self.logger.error(f"Error handling ExitPlanMode: {e}")
-                import traceback
-                self.logger.error(f"Traceback:\n{traceback.format_exc()}")
+                self.logger.exception("Error handling ExitPlanMode: %s", e)
                 # On error, allow the tool to proceed
                 return HookHandler.create_allow_response()
 
         return HookHandler.create_allow_response()
 
-    def _save_plan_to_file(self, context: Dict[str, Any]) -> str:
+    def _save_plan_to_file(
+        self, context: Dict[str, Any], now: Optional[datetime] = None
+    ) -> str:
         """Save plan content from ExitPlanMode tool to a markdown file
 
         Args:
             context: Hook context containing tool input
+            now: Time the plan was saved (defaults to the current time)
 
         Returns:
             Full path to the saved plan file
@@ -183,23 +194,25 @@ class PlancheckMonitor(BaseExtension):
             plan_title = self._extract_plan_title(plan_content)
 
             # Create plans directory
-            plans_dir = Path(self.orchestra_dir) / "plans"
-            plans_dir.mkdir(parents=True, exist_ok=True)
+            plans_dir = self.plans_dir
+            ensure_dir(plans_dir)
 
             # Generate filename with timestamp and sanitized title
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            if now is None:
+                now = datetime.now()
+            timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
             sanitized_title = self._sanitize_filename(plan_title)
             filename = f"{timestamp}_{sanitized_title}.md"
             plan_file = plans_dir / filename
 
-            # Write plan content to file
-            with open(plan_file, 'w', encoding='utf-8') as f:
-                f.write(f"# {plan_title}\n\n")
-                f.write(f"*Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-                f.write(plan_content)
-                f.write("\n")
+            # Write plan content to file in one go, bypassing the text-mode layer
+            plan_file.write_bytes(
+                f"# {plan_title}\n\n"
+                f"*Created: {now.strftime('%Y-%m-%d %H:%M:%S')}*\n\n"
+                f"{plan_content}\n".encode('utf-8')
+            )
 
-            self.logger.info(f"Plan saved to: {plan_file}")
+            self.logger.info("Plan saved to: %s", plan_file)
 
             # Update counter and save state
             self.plans_saved += 1
@@ -208,9 +221,7 @@ class PlancheckMonitor(BaseExtension):
             return str(plan_file)
 
         except Exception as e:
-            self.logger.error(f"Failed to save plan to file: {e}")
-            import traceback
-            self.logger.error(f"Traceback:\n{traceback.format_exc()}")
+            self.logger.exception("Failed to save plan to file: %s", e)
             return "error-saving-plan"
 
     def _extract_plan_title(self, plan_content: str) -> str:
@@ -222,27 +233,26 @@ class PlancheckMonitor(BaseExtension):
         Returns:
             Extracted or generated title
         """
-        # Try to find first heading
-        lines = plan_content.strip().split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith('# '):
-                return line[2:].strip()
-            elif line.startswith('## '):
-                return line[3:].strip()
+        # Titles live near the top; don't split the whole plan to find one
+        # (each line is stripped below, so no copy of the whole plan is needed)
+        lines = plan_content.split('\n', _TITLE_SCAN_LINES)[:_TITLE_SCAN_LINES]
 
-        # Try to find first meaningful sentence
+        # Prefer the first heading; otherwise fall back to the first
+        # meaningful sentence
+        fallback = None
         for line in lines:
             line = line.strip()
-            if line and not line.startswith('#') and len(line) > 10:
+            if line.startswith(('# ', '## ')):
+                # Drop the '#' markers and the space after them
+                return line[line.index(' ') + 1:].strip()
+            elif fallback is None and line and not line.startswith('#') and len(line) > 10:
                 # Take first 50 characters and clean up
-                title = line[:50].strip()
-                if title.endswith('.'):
-                    title = title[:-1]
-                return title
+                fallback = line[:50].strip()
+                if fallback.endswith('.'):
+                    fallback = fallback[:-1]
 
         # Fallback to generic title
-        return "Plan"
+        return fallback or "Plan"
 
     def _sanitize_filename(self, title: str) -> str:
         """Sanitize title for use as filename
@@ -253,9 +263,8 @@ class PlancheckMonitor(BaseExtension):
         Returns:
             Sanitized filename-safe string
         """
-        # Remove/replace problematic characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '', title)
-        sanitized = re.sub(r'\s+', '-', sanitized)
+        # Remove problematic characters and hyphenate whitespace runs
+        sanitized = '-'.join(title.translate(_FILENAME_DELETE_CHARS).split())
         sanitized = sanitized.strip('-').lower()
 
         # Limit length
@@ -441,7 +450,8 @@ def main():
         # Handle hook invocation
         hook_event = sys.argv[2]
         try:
-            context = json.load(sys.stdin)
+            # Decode the raw bytes directly, skipping the text-mode stdin wrapper
+            context = _json_loads(sys.stdin.buffer.read())
             result = monitor.handle_hook(hook_event, context)
             print(json.dumps(result))
         except Exception as e:
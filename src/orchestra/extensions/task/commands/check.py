@@ -16,9 +16,14 @@ from orchestra.common.core_command import CoreCommand
 class TaskCheckCommand(CoreCommand):
     """Check for task deviations using external Claude instance"""
 
-    def __init__(self, model: str = "haiku", logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        model: str = "haiku",
+        logger: Optional[logging.Logger] = None,
+        cache_dir: Optional[str] = None,
+    ):
         """Initialize with fast model for quick analysis"""
-        super().__init__(model=model, logger=logger)
+        super().__init__(model=model, logger=logger, cache_dir=cache_dir)
 
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """Validate input has required fields"""
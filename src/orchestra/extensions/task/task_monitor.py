@@ -7,10 +7,14 @@ Direct integration with Claude Code hooks - no extra scripts needed
 import json
 import logging
 import os
+import re
 import sys
+import traceback
+from collections import deque
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, BinaryIO, Deque, Dict, List, Optional, Tuple, cast
 
 # Import from common library
 from orchestra.common import (
@@ -23,8 +27,82 @@ from orchestra.common import (
 )
 from orchestra.common.types import HookInput
 
+# orjson is an optional speedup for transcript parsing and JSON output; its
+# decode error subclasses json.JSONDecodeError so callers handle both the same way
+try:
+    from orjson import OPT_INDENT_2
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
+
+    def _dump_json(obj: Any) -> str:
+        return _orjson_dumps(obj, option=OPT_INDENT_2).decode("utf-8")
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _dump_json(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# Tools whose use in the transcript means code was written
+CODE_TOOL_SET = frozenset({"Edit", "Write", "MultiEdit", "NotebookEdit"})
+
+# How much of the transcript end SubagentStop reads to find the last response
+TRANSCRIPT_TAIL_BYTES = 64 * 1024
+
+# PostToolUse only does work for these tools
+_POST_HOOK_INTEREST = frozenset({"TodoWrite", "ExitPlanMode"})
+
+# Claude's todo priorities mapped to requirement priorities (1 is highest)
+_PRIORITY_MAP = {"high": 1, "medium": 2, "low": 3}
+
+# Phrases in a subagent's analysis that ask Claude to keep working
+_CONTINUE_INDICATORS = (
+    "should continue",
+    "keep working",
+    "not complete",
+    "incomplete",
+    "more work needed",
+    "requirements remaining",
+    "next step",
+    "focus on",
+)
+
+# Phrases in a subagent's analysis that allow Claude to stop
+_STOP_INDICATORS = (
+    "can stop",
+    "task complete",
+    "all requirements met",
+    "finished",
+    "done",
+    "no more work",
+)
+
+# Line markers that name what the subagent wants worked on next
+_FOCUS_MARKERS = ("focus on", "next:")
+
+# Stop hook reason when code was written since the last stop
+_REVIEW_REASON = (
+    "Ask code-reviewer, over-engineering-detector, and off-topic-detector agents "
+    "to review the code changes made since the last stop."
+)
+
+# One alternation per list scans the response once instead of once per phrase
+_CONTINUE_PATTERN = re.compile("|".join(map(re.escape, _CONTINUE_INDICATORS)))
+_STOP_PATTERN = re.compile("|".join(map(re.escape, _STOP_INDICATORS)))
+
 
 class TaskAlignmentMonitor(GitAwareExtension):
+    # Hook type -> handler method name, looked up once per hook
+    _HANDLERS: Dict[str, str] = {
+        "Stop": "_handle_stop_hook",
+        "SubagentStop": "_handle_subagent_stop_hook",
+        "TodoWrite": "_handle_todowrite_hook",
+        "Task": "_handle_task_hook",
+        "PreToolUse": "_handle_pre_tool_use_hook",
+        "PostToolUse": "_handle_post_tool_use_hook",
+    }
+
     def __init__(self, config_path: Optional[str] = None) -> None:
         # Use CLAUDE_WORKING_DIR if available, otherwise use common project directory logic
         working_dir = os.environ.get("CLAUDE_WORKING_DIR")
@@ -56,6 +134,10 @@ class TaskAlignmentMonitor(GitAwareExtension):
         self.stats: Dict[str, int] = {}
         self.last_stop_message_id: Optional[str] = None
         self.last_review_request_message_id: Optional[str] = None
+        self.last_transcript_path: Optional[str] = None
+        self.last_transcript_offset: int = 0
+        # Set when a hook changes state; handle_hook saves once at the end
+        self._dirty = False
         self.load_config()
 
         # Load or create git task state if in git repo
@@ -85,6 +167,8 @@ class TaskAlignmentMonitor(GitAwareExtension):
         self.stats = state.get("stats", {"deviations": 0, "commands": 0})
         self.last_stop_message_id = state.get("last_stop_message_id")
         self.last_review_request_message_id = state.get("last_review_request_message_id")
+        self.last_transcript_path = state.get("last_transcript_path")
+        self.last_transcript_offset = state.get("last_transcript_offset", 0)
 
         return state
 
@@ -97,7 +181,9 @@ class TaskAlignmentMonitor(GitAwareExtension):
                 "stats": self.stats,
                 "last_stop_message_id": self.last_stop_message_id,
                 "last_review_request_message_id": self.last_review_request_message_id,
-                "updated": datetime.now().isoformat(),
+                "last_transcript_path": self.last_transcript_path,
+                "last_transcript_offset": self.last_transcript_offset,
+                "updated": datetime.now().isoformat(timespec="seconds"),
             }
 
             # Include git task state if available
@@ -105,6 +191,11 @@ class TaskAlignmentMonitor(GitAwareExtension):
                 config["git_task_state"] = self.current_task_state.to_dict()
 
         super().save_config(config)
+        self._dirty = False
+
+    def _mark_dirty(self) -> None:
+        """Schedule a state save for the end of the current hook"""
+        self._dirty = True
 
     def hook_compatible_input(self, id: int, prompt: str, current_input: str) -> str:
         """behaves like input() in tty mode, but is compatible with Claude Code hooks"""
@@ -134,33 +225,32 @@ class TaskAlignmentMonitor(GitAwareExtension):
         return current_input
 
     def handle_hook(self, hook_type: str, context: HookInput) -> Dict[str, Any]:
-        """Universal hook handler - handles Stop and SubagentStop hooks"""
-        self.logger.info(f"Handling hook: {hook_type}")
-        self.logger.debug(f"Hook context: {format_hook_context(context)}")
+        """Universal hook handler - handles Stop and SubagentStop hooks
+
+        State changed while handling the hook is written once, afterwards.
+        """
+        try:
+            return self._dispatch_hook(hook_type, context)
+        finally:
+            if self._dirty:
+                self.save_config()
+
+    def _dispatch_hook(self, hook_type: str, context: HookInput) -> Dict[str, Any]:
+        """Route a hook to its handler"""
+        self.logger.info("Handling hook: %s", hook_type)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Hook context: %s", format_hook_context(context))
         # coontext will be type HookInputTodo
-        if hook_type == "Stop":
-            return self._handle_stop_hook(context)
-        if hook_type == "UserPromptSubmit":
-            # Handle UserPromptSubmit hook specifically
-            self.logger.debug("Handling UserPromptSubmit hook")
-            return self._handle_user_prompt_submit_hook(context)
-        if hook_type == "SubagentStop":
-            return self._handle_subagent_stop_hook(context)
-        if hook_type == "TodoWrite":
-            return self._handle_todowrite_hook(context)
-        if hook_type == "Task":
-            return self._handle_task_hook(context)
-        if hook_type == "PreToolUse":
-            return self._handle_pre_tool_use_hook(context)
-        if hook_type == "PostToolUse":
-            return self._handle_post_tool_use_hook(context)
+        handler_name = self._HANDLERS.get(hook_type)
+        if handler_name:
+            return cast(Dict[str, Any], getattr(self, handler_name)(context))
 
         return context
 
     def _handle_stop_hook(self, context: HookInput) -> Dict[str, Any]:
         """Handle Stop hook by analyzing conversation and determining if Claude should continue"""
         self.logger.debug(
-            f"_handle_stop_hook called with context keys: {list(context.keys())}"
+            "_handle_stop_hook called with context keys: %s", context.keys()
         )
 
         # Allow stop hook to run regardless of task configuration
@@ -176,7 +266,11 @@ class TaskAlignmentMonitor(GitAwareExtension):
             current_message_id = self._get_current_message_id(context)
             transcript_path = context.get("transcript_path")
 
-            self.logger.debug(f"Stop hook - message_id: {current_message_id}, transcript: {transcript_path}")
+            self.logger.debug(
+                "Stop hook - message_id: %s, transcript: %s",
+                current_message_id,
+                transcript_path,
+            )
 
             # Check if we should request a review based on transcript analysis
             should_request_review = False
@@ -197,12 +291,11 @@ class TaskAlignmentMonitor(GitAwareExtension):
 
                 # Update last stop message ID
                 self.last_stop_message_id = current_message_id
-                self.save_config()
+                self._mark_dirty()
 
             if should_request_review:
-                review_reason = "Ask code-reviewer, over-engineering-detector, and off-topic-detector agents to review the code changes made since the last stop."
-                self.logger.info(f"Blocking stop for review: {review_reason}")
-                return HookHandler.create_block_response(review_reason)
+                self.logger.info("Blocking stop for review: %s", _REVIEW_REASON)
+                return HookHandler.create_block_response(_REVIEW_REASON)
 
             # Allow stopping if no review needed
             self.logger.info("No review needed - allowing stop")
@@ -210,18 +303,16 @@ class TaskAlignmentMonitor(GitAwareExtension):
 
         except Exception as e:
             self.logger.error(
-                f"Stop hook analysis failed with exception: {type(e).__name__}: {e}"
+                "Stop hook analysis failed with exception: %s: %s", type(e).__name__, e
             )
-            import traceback
-
-            self.logger.error(f"Traceback:\n{traceback.format_exc()}")
+            self.logger.error("Traceback:\n%s", traceback.format_exc())
             # On error, allow stopping to avoid blocking Claude
             return HookHandler.create_allow_response()
 
     def _handle_subagent_stop_hook(self, context: HookInput) -> Dict[str, Any]:
         """Handle SubagentStop hook by parsing subagent results"""
         self.logger.debug(
-            f"_handle_subagent_stop_hook called with context keys: {list(context.keys())}"
+            "_handle_subagent_stop_hook called with context keys: %s", context.keys()
         )
 
         try:
@@ -231,73 +322,57 @@ class TaskAlignmentMonitor(GitAwareExtension):
                 self.logger.error("No transcript_path in SubagentStop context")
                 return HookHandler.create_allow_response()
 
-            self.logger.debug(f"Reading transcript from: {transcript_path}")
-
-            # Read the transcript file
-            with open(transcript_path) as f:
-                transcript_content = f.read()
-
-            # Parse the tail of the transcript to get subagent response
-            # Look for the last assistant message which should contain the analysis
-            lines = transcript_content.strip().split("\n")
-
-            # Find the last assistant response
-            assistant_response = ""
-            in_assistant_block = False
-            for line in reversed(lines):
-                if line.strip().startswith("assistant:"):
-                    in_assistant_block = True
-                elif line.strip().startswith("user:") and in_assistant_block:
-                    break
-                elif in_assistant_block:
-                    assistant_response = line + "\n" + assistant_response
-
-            self.logger.debug(
-                f"Parsed assistant response: {truncate_value(assistant_response, 200)}"
+            self.logger.debug("Reading transcript from: %s", transcript_path)
+
+            # Read only the tail of the transcript; the subagent's analysis is
+            # the last assistant message, so earlier history rarely matters
+            with open(transcript_path, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                start = max(0, size - TRANSCRIPT_TAIL_BYTES)
+                f.seek(start)
+                tail = f.read().decode("utf-8", "replace")
+            if start:
+                # Drop the line the tail window cut through
+                tail = tail.partition("\n")[2]
+
+            assistant_response, complete = self._find_last_assistant_response(
+                tail.strip().splitlines()
             )
+            if start and not complete:
+                # The assistant block starts before the tail window
+                self.logger.debug("Assistant response exceeds transcript tail, reading full file")
+                with open(transcript_path, encoding="utf-8", errors="replace") as f:
+                    transcript_content = f.read()
+                assistant_response, _ = self._find_last_assistant_response(
+                    transcript_content.strip().splitlines()
+                )
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Parsed assistant response: %s",
+                    truncate_value(assistant_response, 200),
+                )
 
             # Analyze the subagent response
             response_lower = assistant_response.lower()
 
-            # Check for indicators that we should continue working
-            continue_indicators = [
-                "should continue",
-                "keep working",
-                "not complete",
-                "incomplete",
-                "more work needed",
-                "requirements remaining",
-                "next step",
-                "focus on",
-            ]
-
-            # Check for indicators that we can stop
-            stop_indicators = [
-                "can stop",
-                "task complete",
-                "all requirements met",
-                "finished",
-                "done",
-                "no more work",
-            ]
-
-            should_continue = any(
-                indicator in response_lower for indicator in continue_indicators
-            )
-            should_stop = any(
-                indicator in response_lower for indicator in stop_indicators
-            )
+            should_continue = _CONTINUE_PATTERN.search(response_lower) is not None
+            should_stop = _STOP_PATTERN.search(response_lower) is not None
 
             self.logger.debug(
-                f"Continue indicators found: {should_continue}, Stop indicators found: {should_stop}"
+                "Continue indicators found: %s, Stop indicators found: %s",
+                should_continue,
+                should_stop,
             )
 
             # If we have clear indication to continue
             if should_continue and not should_stop:
                 # Extract focus area if mentioned
                 focus_area = ""
-                for line in assistant_response.split("\n"):
-                    if "focus on" in line.lower() or "next:" in line.lower():
+                for line, line_lower in zip(
+                    assistant_response.split("\n"), response_lower.split("\n")
+                ):
+                    if any(marker in line_lower for marker in _FOCUS_MARKERS):
                         focus_area = line.strip()
                         break
 
@@ -305,7 +380,7 @@ class TaskAlignmentMonitor(GitAwareExtension):
                 if focus_area:
                     reason += f". {focus_area}"
 
-                self.logger.info(f"Blocking based on subagent analysis: {reason}")
+                self.logger.info("Blocking based on subagent analysis: %s", reason)
                 return HookHandler.create_block_response(reason)
 
             # Otherwise allow stopping
@@ -313,13 +388,32 @@ class TaskAlignmentMonitor(GitAwareExtension):
             return HookHandler.create_allow_response()
 
         except Exception as e:
-            self.logger.error(f"Error in SubagentStop hook: {e}")
-            import traceback
-
-            self.logger.error(f"Traceback:\n{traceback.format_exc()}")
+            self.logger.error("Error in SubagentStop hook: %s", e)
+            self.logger.error("Traceback:\n%s", traceback.format_exc())
             # On error, fall back to allowing stop
             return HookHandler.create_allow_response()
 
+    def _find_last_assistant_response(self, lines: List[str]) -> Tuple[str, bool]:
+        """Collect the last assistant block from transcript lines
+
+        Args:
+            lines: Transcript lines in file order
+
+        Returns:
+            Tuple of the assistant response and whether the preceding user
+            line was found, i.e. the block lies entirely within ``lines``
+        """
+        parts: Deque[str] = deque()
+        in_assistant_block = False
+        for line in reversed(lines):
+            if line.strip().startswith("assistant:"):
+                in_assistant_block = True
+            elif line.strip().startswith("user:") and in_assistant_block:
+                return "\n".join(parts), True
+            elif in_assistant_block:
+                parts.appendleft(line)
+        return "\n".join(parts), False
+
     def _handle_todowrite_hook(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle TodoWrite hook by logging the todo changes"""
         self.logger.info("TodoWrite hook triggered")
@@ -329,15 +423,16 @@ class TaskAlignmentMonitor(GitAwareExtension):
             tool_input = context.get("tool_input", {})
             todos = tool_input.get("todos", [])
 
-            self.logger.info(f"TodoWrite: {len(todos)} todos")
-            for todo in todos:
-                self.logger.debug(f"Todo: {truncate_value(todo, 100)}")
+            self.logger.info("TodoWrite: %s todos", len(todos))
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for todo in todos:
+                    self.logger.debug("Todo: %s", truncate_value(todo, 100))
 
             # Allow the tool to proceed
             return HookHandler.create_allow_response()
 
         except Exception as e:
-            self.logger.error(f"Error in TodoWrite hook: {e}")
+            self.logger.error("Error in TodoWrite hook: %s", e)
             return HookHandler.create_allow_response()
 
     def _handle_task_hook(self, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -351,32 +446,33 @@ class TaskAlignmentMonitor(GitAwareExtension):
             description = tool_input.get("description", "")
             prompt = tool_input.get("prompt", "")
 
-            self.logger.info(f"Task subagent: {subagent_type}")
-            self.logger.info(f"Task description: {description}")
-            self.logger.debug(f"Task prompt: {prompt[:200]}...")
+            self.logger.info("Task subagent: %s", subagent_type)
+            self.logger.info("Task description: %s", description)
+            self.logger.debug("Task prompt: %s...", prompt[:200])
 
             # Allow the tool to proceed
             return HookHandler.create_allow_response()
 
         except Exception as e:
-            self.logger.error(f"Error in Task hook: {e}")
+            self.logger.error("Error in Task hook: %s", e)
             return HookHandler.create_allow_response()
 
     def _handle_pre_tool_use_hook(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle PreToolUse hook by logging the tool about to be used"""
         tool_name = context.get("tool_name", "unknown")
-        self.logger.info(f"PreToolUse hook: {tool_name}")
+        self.logger.info("PreToolUse hook: %s", tool_name)
 
         try:
             # Log the tool input
-            tool_input = context.get("tool_input", {})
-            self.logger.debug(f"Tool input: {json.dumps(tool_input, indent=2)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                tool_input = context.get("tool_input", {})
+                self.logger.debug("Tool input: %s", json.dumps(tool_input, indent=2))
 
             # Allow the tool to proceed
             return HookHandler.create_allow_response()
 
         except Exception as e:
-            self.logger.error(f"Error in PreToolUse hook: {e}")
+            self.logger.error("Error in PreToolUse hook: %s", e)
             return HookHandler.create_allow_response()
 
     def _handle_post_tool_use_hook(self, context: HookInput) -> Dict[str, Any]:
@@ -385,24 +481,29 @@ class TaskAlignmentMonitor(GitAwareExtension):
         event_name = context.get("hook_event_name", "unknown")
         is_todo_write = tool_name == "TodoWrite"
         is_exit_plan_mode = tool_name == "ExitPlanMode"
-        self.logger.info(f"PostToolUse hook: tool={tool_name} event={event_name}")
+        self.logger.info("PostToolUse hook: tool=%s event=%s", tool_name, event_name)
+
+        # Most tools need nothing beyond the log line above
+        if tool_name not in _POST_HOOK_INTEREST:
+            return HookHandler.create_allow_response()
 
         try:
             # Log the tool response
-            tool_response = context.get("tool_response", {})
-            self.logger.debug(f"Tool response: {json.dumps(tool_response, indent=2)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                tool_response = context.get("tool_response", {})
+                self.logger.debug("Tool response: %s", truncate_value(tool_response, 300))
             tool_input = context.get("tool_input", {})
 
             if is_todo_write:
                 # If this is a TodoWrite, sync the todos from tool_input
                 todos = tool_input.get("todos", [])
-                self.logger.info(f"PostToolUse TodoWrite: {len(todos)} todos to sync")
+                self.logger.info("PostToolUse TodoWrite: %s todos to sync", len(todos))
 
                 # Sync Claude's todos into our task monitor state
                 self._sync_claude_todos(todos)
 
                 # Save the updated state
-                self.save_config()
+                self._mark_dirty()
 
             elif is_exit_plan_mode:
                 # If this is an ExitPlanMode, save the plan to .claude/plans/
@@ -413,10 +514,8 @@ class TaskAlignmentMonitor(GitAwareExtension):
             return HookHandler.create_allow_response()
 
         except Exception as e:
-            self.logger.error(f"Error in PostToolUse hook: {e}")
-            import traceback
-
-            self.logger.error(f"Traceback:\n{traceback.format_exc()}")
+            self.logger.error("Error in PostToolUse hook: %s", e)
+            self.logger.error("Traceback:\n%s", traceback.format_exc())
             return HookHandler.create_allow_response()
 
 
@@ -426,47 +525,40 @@ class TaskAlignmentMonitor(GitAwareExtension):
         Args:
             todos: List of todo items from Claude's TodoWrite tool
         """
-        self.logger.info(f"Syncing {len(todos)} todos from Claude")
-
-        # Clear existing requirements
-        self.requirements = []
+        self.logger.info("Syncing %s todos from Claude", len(todos))
 
-        # Convert Claude's todos to TaskRequirements
-        for i, todo in enumerate(todos):
-            # Map Claude's priority (high/medium/low) to numeric (1-5)
-            priority_map = {"high": 1, "medium": 2, "low": 3}
-            priority = priority_map.get(todo.get("priority", "medium"), 2)
-
-            # Map Claude's status to completed boolean
-            status = todo.get("status", "pending")
-            completed = status == "completed"
-
-            # Create TaskRequirement
-            requirement = TaskRequirement(
+        # Convert Claude's todos to TaskRequirements, mapping Claude's
+        # priority (high/medium/low) to numeric and status to completed
+        self.requirements = [
+            TaskRequirement(
                 id=todo.get("id", str(i)),
                 description=todo.get("content", ""),
-                priority=priority,
-                completed=completed,
+                priority=_PRIORITY_MAP.get(todo.get("priority", "medium"), 2),
+                completed=todo.get("status", "pending") == "completed",
             )
+            for i, todo in enumerate(todos)
+        ]
 
-            self.requirements.append(requirement)
-            self.logger.debug(
-                f"Synced todo: {requirement.description} (P{priority}, {'completed' if completed else 'pending'})"
-            )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for requirement in self.requirements:
+                self.logger.debug(
+                    "Synced todo: %s (P%s, %s)",
+                    requirement.description,
+                    requirement.priority,
+                    "completed" if requirement.completed else "pending",
+                )
 
         # Update task description if we have todos
         if todos and not self.task:
             # Use the first high-priority todo as the task description
-            high_priority_todos = [t for t in todos if t.get("priority") == "high"]
-            if high_priority_todos:
-                self.task = (
-                    f"Task: {high_priority_todos[0].get('content', 'Unnamed task')}"
-                )
+            first_high = next((t for t in todos if t.get("priority") == "high"), None)
+            if first_high is not None:
+                self.task = f"Task: {first_high.get('content', 'Unnamed task')}"
             else:
                 self.task = f"Task with {len(todos)} requirements"
 
         self.logger.info(
-            f"Task monitor state synced: {len(self.requirements)} requirements"
+            "Task monitor state synced: %s requirements", len(self.requirements)
         )
 
     def _save_plan_to_file(self, tool_input: Dict[str, Any]) -> None:
@@ -489,23 +581,23 @@ class TaskAlignmentMonitor(GitAwareExtension):
             # Create plans directory if it doesn't exist
             plans_dir.mkdir(parents=True, exist_ok=True)
 
-            # Generate filename with timestamp
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            # Generate filename with timestamp; the header uses the same instant
+            now = datetime.now()
+            timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
             filename = f"plan_{timestamp}.md"
             plan_file = plans_dir / filename
 
             # Write plan content to file
-            with open(plan_file, 'w', encoding='utf-8') as f:
-                f.write(f"# Plan - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write(plan_content)
-                f.write("\n")
+            plan_file.write_text(
+                f"# Plan - {now:%Y-%m-%d %H:%M:%S}\n\n{plan_content}\n",
+                encoding="utf-8",
+            )
 
-            self.logger.info(f"Plan saved to: {plan_file}")
+            self.logger.info("Plan saved to: %s", plan_file)
 
         except Exception as e:
-            self.logger.error(f"Failed to save plan to file: {e}")
-            import traceback
-            self.logger.error(f"Traceback:\n{traceback.format_exc()}")
+            self.logger.error("Failed to save plan to file: %s", e)
+            self.logger.error("Traceback:\n%s", traceback.format_exc())
 
     def _parse_transcript_for_code_events(self, transcript_path: str) -> bool:
         """Parse transcript to detect if code was written since last stop message
@@ -517,45 +609,101 @@ class TaskAlignmentMonitor(GitAwareExtension):
             True if code writing events were detected, False otherwise
         """
         try:
-            if not os.path.exists(transcript_path):
-                self.logger.warning(f"Transcript file not found: {transcript_path}")
+            try:
+                f = open(transcript_path, "rb")
+            except FileNotFoundError:
+                self.logger.warning("Transcript file not found: %s", transcript_path)
                 return False
 
-            with open(transcript_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            # Find the starting point (last stop message ID or beginning)
-            start_index = 0
-            if self.last_stop_message_id:
-                for i, line in enumerate(lines):
-                    if self.last_stop_message_id in line:
-                        start_index = i
-                        break
-
-            # Look for code writing indicators in messages after the start point
-            code_indicators = [
-                '"tool_name": "Edit"',
-                '"tool_name": "Write"',
-                '"tool_name": "MultiEdit"',
-                '"tool_name": "NotebookEdit"',
-                'function_name": "Edit"',
-                'function_name": "Write"',
-                'function_name": "MultiEdit"',
-                'function_name": "NotebookEdit"'
-            ]
-
-            for line in lines[start_index:]:
-                if any(indicator in line for indicator in code_indicators):
-                    self.logger.info("Code writing detected in transcript since last stop")
-                    return True
+            with f:
+                size = os.fstat(f.fileno()).st_size
+
+                # Resume where the previous scan of this transcript ended. A
+                # file that shrank was truncated or replaced, so start over
+                if (
+                    transcript_path == self.last_transcript_path
+                    and 0 < self.last_transcript_offset <= size
+                ):
+                    f.seek(self.last_transcript_offset)
+                # Otherwise find the starting point (last stop message ID or beginning)
+                elif self.last_stop_message_id:
+                    f.seek(self._find_message_offset(f, self.last_stop_message_id))
+
+                # Look for code writing tools in messages after the start point.
+                # A trailing line without a newline may still be being written,
+                # so the cursor stops before it
+                partial = 0
+                for line in f:
+                    partial = 0 if line.endswith(b"\n") else len(line)
+                    try:
+                        event = _json_loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+                    if not isinstance(event, dict):
+                        continue
+                    if (
+                        event.get("tool_name") in CODE_TOOL_SET
+                        or event.get("function_name") in CODE_TOOL_SET
+                    ):
+                        self.logger.info("Code writing detected in transcript since last stop")
+                        self._update_transcript_cursor(transcript_path, size)
+                        return True
+
+                self._update_transcript_cursor(transcript_path, f.tell() - partial)
 
             self.logger.debug("No code writing detected in transcript since last stop")
             return False
 
         except Exception as e:
-            self.logger.error(f"Failed to parse transcript for code events: {e}")
+            self.logger.error("Failed to parse transcript for code events: %s", e)
             return False
 
+    def _find_message_offset(self, f: BinaryIO, message_id: str) -> int:
+        """Find the byte offset of the transcript line for a message
+
+        A cheap byte search picks candidate lines; only those are parsed, so
+        an ID that merely appears in another message's content (or as its
+        parent) does not count as the message itself.
+
+        Args:
+            f: Transcript opened in binary mode, positioned at the start
+            message_id: uuid or id of the message to find
+
+        Returns:
+            Offset of the message's line, or 0 if it is not in the transcript
+        """
+        marker = message_id.encode("utf-8")
+        offset = 0
+        for line in f:
+            if marker in line:
+                try:
+                    event = _json_loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    event = None
+                if isinstance(event, dict):
+                    message = event.get("message")
+                    if (
+                        event.get("uuid") == message_id
+                        or event.get("id") == message_id
+                        or (isinstance(message, dict) and message.get("id") == message_id)
+                    ):
+                        return offset
+            offset += len(line)
+        return 0
+
+    def _update_transcript_cursor(self, transcript_path: str, offset: int) -> None:
+        """Remember how far a transcript has been scanned
+
+        The caller persists the cursor with save_config() so the next Stop
+        hook only reads lines appended since this one.
+
+        Args:
+            transcript_path: Path to the scanned transcript file
+            offset: Byte offset the next scan should start from
+        """
+        self.last_transcript_path = transcript_path
+        self.last_transcript_offset = offset
+
     def _get_current_message_id(self, context: HookInput) -> Optional[str]:
         """Extract current message ID from hook context
 
@@ -574,7 +722,7 @@ class TaskAlignmentMonitor(GitAwareExtension):
         if not self.requirements:
             return {"percentage": 0, "completed": 0, "total": 0}
 
-        completed = sum(1 for r in self.requirements if r.completed)
+        completed = sum(r.completed for r in self.requirements)
         return {
             "percentage": (completed / len(self.requirements)) * 100,
             "completed": completed,
@@ -583,9 +731,12 @@ class TaskAlignmentMonitor(GitAwareExtension):
 
     def _get_current_requirement(self) -> str:
         """Get highest priority incomplete requirement"""
-        incomplete = [r for r in self.requirements if not r.completed]
-        if incomplete:
-            next_req = min(incomplete, key=lambda x: x.priority)
+        next_req = min(
+            (r for r in self.requirements if not r.completed),
+            key=attrgetter("priority"),
+            default=None,
+        )
+        if next_req is not None:
             return next_req.description
         return "All complete"
 
@@ -905,13 +1056,14 @@ def main() -> None:
         # Check if .claude/orchestra/ is in .gitignore
         working_dir = os.environ.get("CLAUDE_WORKING_DIR", ".")
         gitignore_path = Path(working_dir) / ".gitignore"
-        if gitignore_path.exists():
-            with open(gitignore_path) as f:
-                gitignore_content = f.read()
-                if ".claude/orchestra/" not in gitignore_content:
-                    print(
-                        "\n💡 Tip: Consider adding '.claude/orchestra/' to your .gitignore file"
-                    )
+        try:
+            gitignore_content = gitignore_path.read_bytes()
+        except OSError:
+            gitignore_content = None
+        if gitignore_content is not None and b".claude/orchestra/" not in gitignore_content:
+            print(
+                "\n💡 Tip: Consider adding '.claude/orchestra/' to your .gitignore file"
+            )
 
     elif command == "status":
         if not monitor.requirements:
@@ -921,22 +1073,25 @@ def main() -> None:
             )
             return None
 
+        # Build the report up front and write it in one call rather than one
+        # write per line, which matters when stdout is a pipe
         progress = monitor._get_progress()
-        print(f"\n📌 Task: {monitor.task or 'Synced from Claude'}")
-        print(f"📊 Progress: {progress['percentage']:.0f}% complete")
-        print(
-            f"📈 Stats: {monitor.stats['commands']} commands, {monitor.stats['deviations']} deviations"
+        lines = [
+            f"\n📌 Task: {monitor.task or 'Synced from Claude'}",
+            f"📊 Progress: {progress['percentage']:.0f}% complete",
+            f"📈 Stats: {monitor.stats['commands']} commands, {monitor.stats['deviations']} deviations",
+            "\n📋 Requirements (synced from Claude):",
+        ]
+        lines.extend(
+            f"  {'✅' if r.completed else '⏳'} {r.description} (P{r.priority})"
+            for r in monitor.requirements
         )
-        print("\n📋 Requirements (synced from Claude):")
-
-        for requirement in monitor.requirements:
-            icon = "✅" if requirement.completed else "⏳"
-            print(f"  {icon} {requirement.description} (P{requirement.priority})")
 
         if progress["percentage"] < 100:
-            print(f"\n➡️  Next: {monitor._get_next_action()}")
+            lines.append(f"\n➡️  Next: {monitor._get_next_action()}")
 
-        print("\n🔄 Auto-synced from Claude's todo list")
+        lines.append("\n🔄 Auto-synced from Claude's todo list")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     elif command == "reset":
         # Deprecated - todos sync from Claude
@@ -961,6 +1116,7 @@ def main() -> None:
 
     elif command == "slash-command":
         # Output slash command configuration for Claude Code
+        script_path = os.path.abspath(__file__)
         slash_config = {
             "commands": {
                 "/task": {
@@ -968,29 +1124,29 @@ def main() -> None:
                     "subcommands": {
                         "init": {
                             "description": "Initialize task monitor hooks",
-                            "command": f"python {os.path.abspath(__file__)} init",
+                            "command": f"python {script_path} init",
                         },
                         "status": {
                             "description": "Check progress (synced from Claude's todos)",
-                            "command": f"python {os.path.abspath(__file__)} status",
+                            "command": f"python {script_path} status",
                         },
                         "next": {
                             "description": "Show next priority action",
-                            "command": f"python {os.path.abspath(__file__)} next",
+                            "command": f"python {script_path} next",
                         },
                         "focus": {
                             "description": "Get reminder of current focus area",
-                            "command": f"python {os.path.abspath(__file__)} focus",
+                            "command": f"python {script_path} focus",
                         },
                     },
                 },
                 "/focus": {
                     "description": "Quick reminder of what to work on next (from Claude's todos)",
-                    "command": f"python {os.path.abspath(__file__)} focus",
+                    "command": f"python {script_path} focus",
                 },
             }
         }
-        print(json.dumps(slash_config, indent=2))
+        print(_dump_json(slash_config))
 
     elif command == "next":
         # Quick command to show next action
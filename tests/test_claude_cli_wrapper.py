@@ -3,9 +3,12 @@
 Tests for enhanced Claude CLI wrapper
 """
 
+import io
 import json
 import os
 import subprocess
+import sys
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -201,12 +204,17 @@ class TestClaudeCLIWrapper:
         """Test streaming JSON output"""
         # Mock process with streaming stdout
         mock_process = MagicMock()
-        mock_process.stdout = [
-            json.dumps({"type": "init", "session": "123"}) + "\n",
-            json.dumps({"type": "content", "text": "Hello"}) + "\n",
-            json.dumps({"type": "content", "text": " World"}) + "\n",
-            json.dumps({"type": "done"}) + "\n",
-        ]
+        mock_process.stdout = io.BytesIO(
+            "".join(
+                json.dumps(obj) + "\n"
+                for obj in [
+                    {"type": "init", "session": "123"},
+                    {"type": "content", "text": "Hello"},
+                    {"type": "content", "text": " World"},
+                    {"type": "done"},
+                ]
+            ).encode()
+        )
         mock_process.wait.return_value = None
         mock_popen.return_value = mock_process
 
@@ -223,6 +231,50 @@ class TestClaudeCLIWrapper:
         assert results[2]["text"] == " World"
         assert results[3]["type"] == "done"
 
+    def test_streaming_timeout_without_output(self) -> None:
+        """Test that streaming times out even when the CLI prints nothing"""
+        wrapper = ClaudeCLIWrapper()
+        cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+        start = time.monotonic()
+        results = list(wrapper._invoke_streaming(cmd, timeout=1))
+
+        assert time.monotonic() - start < 10
+        assert results == [{"type": "error", "error": "Timed out after 1 seconds"}]
+
+    def test_streaming_reports_cli_failure(self) -> None:
+        """Test that a non-zero exit while streaming yields an error event"""
+        wrapper = ClaudeCLIWrapper()
+        cmd = [
+            sys.executable,
+            "-c",
+            "import sys; sys.stderr.write('Invalid API key'); sys.exit(1)",
+        ]
+
+        results = list(wrapper._invoke_streaming(cmd, timeout=10))
+
+        assert len(results) == 1
+        assert results[0]["type"] == "error"
+        assert results[0]["exit_code"] == 1
+        assert "exit code 1" in results[0]["error"]
+        assert "Invalid API key" in results[0]["error"]
+
+    def test_streaming_close_terminates_process(self) -> None:
+        """Test that closing the stream early stops the CLI process"""
+        wrapper = ClaudeCLIWrapper()
+        cmd = [
+            sys.executable,
+            "-c",
+            "import time; print('{\"type\": \"init\"}', flush=True); time.sleep(30)",
+        ]
+
+        start = time.monotonic()
+        results = wrapper._invoke_streaming(cmd, timeout=60)
+        assert next(results) == {"type": "init"}
+        results.close()
+
+        assert time.monotonic() - start < 10
+
     @patch("subprocess.run")
     def test_convenience_function(self, mock_run: Mock) -> None:
         """Test the convenience function"""
@@ -414,3 +414,155 @@ class TestPredicateSystem:
         assert "scope-creep-detector" in recommended_types
         assert "off-topic-detector" in recommended_types
         assert "over-engineering-detector" not in recommended_types
+
+    @patch("orchestra.common.subagent_runner.check_predicate")
+    def test_check_all_subagents_fetches_changes_once(self, mock_check):
+        """Test that the task file list is shared across subagent checks"""
+        from orchestra.common.git_task_manager import GitTaskManager
+        from orchestra.common.subagent_runner import SubagentRunner
+        from orchestra.common.task_state import GitTaskState
+
+        mock_check.return_value = {
+            "answer": False,
+            "confidence": 0.9,
+            "reasoning": "On track",
+            "definitive": True,
+        }
+
+        git_manager = Mock(spec=GitTaskManager)
+        git_manager.get_task_file_changes.return_value = ["file1.py"]
+
+        runner = SubagentRunner(git_manager)
+        task_state = GitTaskState(
+            task_id="test-task-3",
+            task_description="Test task",
+            branch_name="test",
+            base_branch="main",
+            base_sha="abc",
+            current_sha="def",
+        )
+
+        result = runner.check_all_subagents(
+            task_state=task_state, analysis_context="Test context"
+        )
+
+        git_manager.get_task_file_changes.assert_called_once_with(task_state)
+        assert mock_check.call_count == len(runner.subagent_types)
+        assert list(result["individual_checks"]) == list(runner.subagent_types)
+        for call in mock_check.call_args_list:
+            assert call.kwargs["context"]["files_changed"] == ["file1.py"]
+
+    def test_invoke_multiple_subagents_diffs_task_branch(self):
+        """Test that the shared diff is taken from the task branch, not HEAD"""
+        from orchestra.common.git_task_manager import GitTaskManager
+        from orchestra.common.subagent_runner import SubagentRunner
+        from orchestra.common.task_state import GitTaskState
+
+        git_manager = Mock(spec=GitTaskManager)
+        git_manager.get_task_diff.return_value = "+change"
+        git_manager.get_task_file_changes.return_value = ["file1.py"]
+        git_manager.create_subagent_branch.side_effect = (
+            lambda state, agent: f"{state.branch_name}/{agent}"
+        )
+
+        runner = SubagentRunner(git_manager)
+        task_state = GitTaskState(
+            task_id="test-task-5",
+            task_description="Test task",
+            branch_name="task/test",
+            base_branch="main",
+            base_sha="abc",
+            current_sha="def",
+        )
+
+        with patch.object(
+            runner, "_dispatch_subagent", return_value={"success": True}
+        ) as mock_dispatch:
+            runner.invoke_multiple_subagents(
+                ["scope-creep-detector", "off-topic-detector"],
+                task_state,
+                "Test context",
+            )
+
+        git_manager.get_task_diff.assert_called_once_with(task_state, "task/test")
+        git_manager.get_task_file_changes.assert_called_once_with(
+            task_state, "task/test"
+        )
+        assert mock_dispatch.call_count == 2
+
+    def test_analysis_prompt_caps_git_context(self):
+        """Test that large file lists and diffs are trimmed in subagent prompts"""
+        from orchestra.common.git_task_manager import GitTaskManager
+        from orchestra.common.subagent_runner import (
+            MAX_PROMPT_DIFF_CHARS,
+            MAX_PROMPT_FILES,
+            SubagentRunner,
+        )
+
+        runner = SubagentRunner(Mock(spec=GitTaskManager))
+        changed_files = [f"file{i}.py" for i in range(MAX_PROMPT_FILES + 5)]
+
+        prompt = runner._build_analysis_prompt(
+            subagent_type="scope-creep-detector",
+            task_description="Test task",
+            diff_output="x" * (MAX_PROMPT_DIFF_CHARS + 10),
+            changed_files=changed_files,
+            analysis_context="Test context",
+            branch_name="test",
+        )
+
+        assert f"Files Changed: {MAX_PROMPT_FILES + 5} files" in prompt
+        assert f"file{MAX_PROMPT_FILES - 1}.py, ...and 5 more" in prompt
+        assert f"file{MAX_PROMPT_FILES}.py" not in prompt
+        assert "[diff truncated, 10 more characters]" in prompt
+
+    @patch("orchestra.common.subagent_runner.check_predicate")
+    def test_check_all_subagents_first_match_only(self, mock_check):
+        """Test early exit once a subagent is decisively recommended"""
+        import threading
+
+        from orchestra.common.git_task_manager import GitTaskManager
+        from orchestra.common.subagent_runner import SubagentRunner
+        from orchestra.common.task_state import GitTaskState
+
+        release = threading.Event()
+
+        def side_effect(question, **kwargs):
+            if "beyond the core requirements" in question:
+                return {
+                    "answer": True,
+                    "confidence": 0.95,
+                    "reasoning": "Scope creep",
+                    "definitive": True,
+                }
+            # The other checks stay in flight until the test finishes
+            release.wait(timeout=5)
+            return {"answer": False, "confidence": 0.9, "definitive": True}
+
+        mock_check.side_effect = side_effect
+
+        git_manager = Mock(spec=GitTaskManager)
+        git_manager.get_task_file_changes.return_value = []
+
+        runner = SubagentRunner(git_manager)
+        task_state = GitTaskState(
+            task_id="test-task-4",
+            task_description="Test task",
+            branch_name="test",
+            base_branch="main",
+            base_sha="abc",
+            current_sha="def",
+        )
+
+        try:
+            result = runner.check_all_subagents(
+                task_state=task_state,
+                analysis_context="Test context",
+                first_match_only=True,
+            )
+        finally:
+            release.set()
+
+        assert list(result["individual_checks"]) == ["scope-creep-detector"]
+        assert result["recommendation_count"] == 1
+        assert result["recommended_subagents"][0]["type"] == "scope-creep-detector"
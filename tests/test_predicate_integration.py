@@ -117,6 +117,35 @@ class TestPredicateIntegration:
                 assert result["definitive"] is True
                 assert "scope-creep-detector" in result["subagent_type"]
 
+    @patch("subprocess.run")
+    def test_extension_check_all_subagents_forwards_first_match_only(self, mock_run):
+        """Test that check_all_subagents passes first_match_only to the runner"""
+        mock_run.return_value = Mock(returncode=0, stdout="")
+
+        with patch.dict(os.environ, {}, clear=True):
+            extension = TestExtension()
+            task_state = GitTaskState(
+                task_id="test-3",
+                task_description="Add user authentication",
+                branch_name="feature/auth",
+                base_branch="main",
+                base_sha="abc123",
+                current_sha="def456",
+            )
+            extension._current_task_state = task_state
+
+            with patch.object(
+                extension.subagent_runner, "check_all_subagents", return_value={}
+            ) as mock_check_all:
+                extension.check_all_subagents("Context", first_match_only=True)
+
+        mock_check_all.assert_called_once_with(
+            task_state=task_state,
+            analysis_context="Context",
+            include_diff=True,
+            first_match_only=True,
+        )
+
     def test_check_predicate_convenience_function(self):
         """Test the module-level check_predicate function"""
         with patch(
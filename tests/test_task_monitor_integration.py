@@ -114,6 +114,167 @@ class TestTaskMonitorIntegration(unittest.TestCase):
         current = monitor._get_current_requirement()
         self.assertEqual(current, "All complete")
 
+    def test_transcript_code_events_since_last_stop(self) -> None:
+        """Test that only code-writing tools after the last stop are detected"""
+        monitor = TaskAlignmentMonitor(self.config_file)
+        transcript_path = os.path.join(self.temp_dir, "transcript.jsonl")
+        lines = [
+            {"id": "msg-1", "tool_name": "Edit"},
+            {"id": "msg-2", "tool_name": "Read"},
+            {"id": "msg-3", "function_name": "Bash"},
+        ]
+        try:
+            with open(transcript_path, "w") as f:
+                f.write("\n".join(json.dumps(line) for line in lines) + "\nnot json\n")
+
+            self.assertTrue(monitor._parse_transcript_for_code_events(transcript_path))
+
+            monitor.last_stop_message_id = "msg-2"
+            self.assertFalse(monitor._parse_transcript_for_code_events(transcript_path))
+
+            with open(transcript_path, "a") as f:
+                f.write(json.dumps({"id": "msg-4", "function_name": "Write"}) + "\n")
+            self.assertTrue(monitor._parse_transcript_for_code_events(transcript_path))
+        finally:
+            os.unlink(transcript_path)
+
+    def test_transcript_last_stop_matches_message_id_exactly(self) -> None:
+        """Test that a message ID mentioned in earlier content is not the stop point"""
+        monitor = TaskAlignmentMonitor(self.config_file)
+        monitor.last_stop_message_id = "msg-2"
+        transcript_path = os.path.join(self.temp_dir, "transcript.jsonl")
+        lines = [
+            {"uuid": "msg-1", "content": "before msg-2", "tool_name": "Edit"},
+            {"uuid": "msg-2", "parentUuid": "msg-1"},
+            {"uuid": "msg-3", "parentUuid": "msg-2", "tool_name": "Read"},
+        ]
+        try:
+            with open(transcript_path, "w") as f:
+                f.write("\n".join(json.dumps(line) for line in lines) + "\n")
+
+            self.assertFalse(monitor._parse_transcript_for_code_events(transcript_path))
+        finally:
+            os.unlink(transcript_path)
+
+    def test_transcript_cursor_persists_between_scans(self) -> None:
+        """Test that a saved cursor skips lines scanned by a previous hook"""
+        monitor = TaskAlignmentMonitor(self.config_file)
+        transcript_path = os.path.join(self.temp_dir, "transcript.jsonl")
+        try:
+            with open(transcript_path, "w") as f:
+                f.write(json.dumps({"tool_name": "Write"}) + "\n")
+
+            self.assertTrue(monitor._parse_transcript_for_code_events(transcript_path))
+            monitor.save_config()
+
+            monitor2 = TaskAlignmentMonitor(self.config_file)
+            self.assertEqual(
+                monitor2.last_transcript_offset, os.path.getsize(transcript_path)
+            )
+            self.assertFalse(monitor2._parse_transcript_for_code_events(transcript_path))
+
+            # A truncated transcript is scanned again from the start
+            with open(transcript_path, "w") as f:
+                f.write(json.dumps({"tool_name": "Edit"}))
+            self.assertTrue(monitor2._parse_transcript_for_code_events(transcript_path))
+        finally:
+            os.unlink(transcript_path)
+
+    def test_subagent_stop_reads_response_beyond_tail(self) -> None:
+        """Test that a long final assistant block is read in full"""
+        monitor = TaskAlignmentMonitor(self.config_file)
+        transcript_path = os.path.join(self.temp_dir, "transcript.jsonl")
+        padding = "x" * 100
+        try:
+            with open(transcript_path, "w") as f:
+                f.write("user: review the task\n")
+                f.write("Next: focus on the failing login test\n")
+                f.write((padding + "\n") * 1000)
+                f.write("assistant:\n")
+
+            result = monitor._handle_subagent_stop_hook(
+                {"transcript_path": transcript_path}
+            )
+            self.assertEqual(result.get("decision"), "block")
+            self.assertIn("focus on the failing login test", result["reason"])
+        finally:
+            os.unlink(transcript_path)
+
+    def test_settings_cache_tracks_file_changes(self) -> None:
+        """Test that cached settings are refreshed when settings.json changes"""
+        import shutil
+        from unittest import mock
+
+        working_dir = tempfile.mkdtemp()
+        try:
+            with mock.patch.dict(os.environ, {"CLAUDE_WORKING_DIR": working_dir}):
+                monitor = TaskAlignmentMonitor(self.config_file)
+                with open(monitor.settings_file, "w") as f:
+                    json.dump({"task": {"strict_mode": False}}, f)
+
+                settings = monitor.get_extension_settings("task")
+                self.assertEqual(settings, {"strict_mode": False})
+
+                # Editing the returned dict must not leak into later reads
+                settings["strict_mode"] = True
+                self.assertEqual(
+                    monitor.get_extension_settings("task"), {"strict_mode": False}
+                )
+
+                with open(monitor.settings_file, "w") as f:
+                    json.dump({"task": {"strict_mode": True, "max_deviations": 5}}, f)
+                self.assertEqual(
+                    monitor.get_extension_settings("task"),
+                    {"strict_mode": True, "max_deviations": 5},
+                )
+        finally:
+            shutil.rmtree(working_dir)
+
+    def test_hook_state_saved_once_after_handling(self) -> None:
+        """Test that state changed by a hook is persisted when it returns"""
+        monitor = TaskAlignmentMonitor(self.config_file)
+        todos = [{"id": "a", "content": "Write tests", "status": "pending"}]
+
+        monitor.handle_hook(
+            "PostToolUse",
+            {"tool_name": "TodoWrite", "tool_input": {"todos": todos}},
+        )
+
+        self.assertFalse(monitor._dirty)
+        monitor2 = TaskAlignmentMonitor(self.config_file)
+        self.assertEqual(
+            [r.description for r in monitor2.requirements], ["Write tests"]
+        )
+
+    def test_concurrent_saves_do_not_collide(self) -> None:
+        """Test that concurrent saves each swap in a complete state file"""
+        import contextlib
+        import io
+        import threading
+
+        monitors = [TaskAlignmentMonitor(self.config_file) for _ in range(4)]
+        for i, monitor in enumerate(monitors):
+            monitor.task = f"Task {i}"
+
+        def save_repeatedly(monitor: TaskAlignmentMonitor) -> None:
+            for _ in range(25):
+                monitor.save_config()
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            threads = [
+                threading.Thread(target=save_repeatedly, args=(m,)) for m in monitors
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertNotIn("Failed to save config", output.getvalue())
+        self.assertEqual(os.listdir(self.temp_dir), ["test-task.json"])
+        with open(self.config_file) as f:
+            self.assertIn(json.load(f)["task"], {f"Task {i}" for i in range(4)})
+
 
 class TestCommandLineInterface(unittest.TestCase):
     """Test the command line interface functionality"""
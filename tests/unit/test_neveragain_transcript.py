@@ -0,0 +1,103 @@
+# ruff: noqa: SLF001
+"""Unit tests for NeverAgain incremental transcript reading"""
+
+import json
+import os
+import tempfile
+
+import pytest
+
+from orchestra.extensions.neveragain.neveragain_monitor import NeverAgainMonitor
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for tests"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def monitor(temp_dir):
+    """Create a NeverAgain monitor instance"""
+    config_path = os.path.join(temp_dir, ".claude", "orchestra", "neveragain.json")
+    os.makedirs(os.path.dirname(config_path), exist_ok=True)
+
+    # Set working directory in environment
+    os.environ["CLAUDE_WORKING_DIR"] = temp_dir
+
+    return NeverAgainMonitor(config_path)
+
+
+@pytest.fixture
+def transcript(temp_dir):
+    """Path to an empty transcript file"""
+    path = os.path.join(temp_dir, "transcript.jsonl")
+    open(path, "wb").close()
+    return path
+
+
+def _message(role, content):
+    return json.dumps({"type": "message", "role": role, "content": content}) + "\n"
+
+
+def _append(path, text):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_incremental_read_after_append(monitor, transcript):
+    """Only lines appended since the last pass are returned"""
+    _append(transcript, _message("user", "first"))
+
+    messages = monitor._parse_new_messages(transcript)
+    assert [m["content"] for m in messages] == ["first"]
+    assert monitor.last_processed_position == os.path.getsize(transcript)
+
+    # Nothing new: no messages and the offset stays put
+    assert monitor._parse_new_messages(transcript) == []
+    assert monitor.last_processed_position == os.path.getsize(transcript)
+
+    _append(transcript, _message("assistant", "second") + _message("user", "third"))
+
+    messages = monitor._parse_new_messages(transcript)
+    assert [(m["role"], m["content"]) for m in messages] == [
+        ("assistant", "second"),
+        ("user", "third"),
+    ]
+    assert monitor.last_processed_position == os.path.getsize(transcript)
+
+
+def test_unterminated_last_line_is_deferred(monitor, transcript):
+    """A partially written last line is left for the next pass"""
+    complete = _message("user", "done")
+    partial = _message("user", "still writing")
+    _append(transcript, complete + partial[:10])
+
+    messages = monitor._parse_new_messages(transcript)
+    assert [m["content"] for m in messages] == ["done"]
+    assert monitor.last_processed_position == len(complete.encode())
+
+    # Finish the line; it is read once, from the saved offset
+    _append(transcript, partial[10:])
+
+    messages = monitor._parse_new_messages(transcript)
+    assert [m["content"] for m in messages] == ["still writing"]
+    assert monitor.last_processed_position == os.path.getsize(transcript)
+
+
+def test_truncated_transcript_resets_offset(monitor, transcript):
+    """A transcript that shrank (truncated or rotated) is read from the start"""
+    _append(transcript, _message("user", "old one") + _message("user", "old two"))
+    monitor._parse_new_messages(transcript)
+    assert monitor.last_processed_position == os.path.getsize(transcript)
+
+    # Replace the file with shorter content
+    replacement = os.path.join(os.path.dirname(transcript), "rotated.jsonl")
+    with open(replacement, "w", encoding="utf-8") as f:
+        f.write(_message("user", "new"))
+    os.replace(replacement, transcript)
+
+    messages = monitor._parse_new_messages(transcript)
+    assert [m["content"] for m in messages] == ["new"]
+    assert monitor.last_processed_position == os.path.getsize(transcript)
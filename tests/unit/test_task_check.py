@@ -301,3 +301,124 @@ class TestTaskCheckCommand:
 
         assert "TRANSCRIPT:" in prompt
         assert "GIT DIFF:" in prompt
+
+    @patch("orchestra.common.claude_cli_wrapper.ClaudeCLIWrapper.invoke")
+    def test_caches_results_for_identical_prompts(self, mock_invoke, tmp_path, monkeypatch):
+        """Test that an opt-in cache skips repeated Claude invocations"""
+        monkeypatch.delenv("ORCHESTRA_CACHE", raising=False)
+        command = TaskCheckCommand(cache_dir=str(tmp_path))
+
+        mock_response = Mock(spec=ClaudeResponse)
+        mock_response.success = True
+        mock_response.content = json.dumps(
+            {"deviation_detected": True, "deviation_type": "off_topic"}
+        )
+        mock_invoke.return_value = mock_response
+
+        input_data = {
+            "transcript": "Refactor CSS",
+            "diff": "+styles",
+            "memory": {"task": "Fix login bug"},
+        }
+        first = command.execute(input_data)
+        second = command.execute(input_data)
+
+        assert first == second
+        assert second["deviation_type"] == "off_topic"
+        assert mock_invoke.call_count == 1
+
+        # Disabling the cache always invokes Claude
+        monkeypatch.setenv("ORCHESTRA_CACHE", "0")
+        command.execute(input_data)
+        assert mock_invoke.call_count == 2
+
+    @patch("orchestra.common.claude_cli_wrapper.ClaudeCLIWrapper.invoke")
+    def test_does_not_cache_parse_fallbacks(self, mock_invoke, tmp_path, monkeypatch):
+        """Test that results carrying an error are never cached"""
+        monkeypatch.delenv("ORCHESTRA_CACHE", raising=False)
+        command = TaskCheckCommand(cache_dir=str(tmp_path))
+
+        mock_response = Mock(spec=ClaudeResponse)
+        mock_response.success = True
+        mock_response.content = "Not JSON at all"
+        mock_invoke.return_value = mock_response
+
+        input_data = {
+            "transcript": "Refactor CSS",
+            "diff": "+styles",
+            "memory": {"task": "Fix login bug"},
+        }
+        first = command.execute(input_data)
+        command.execute(input_data)
+
+        assert "error" in first
+        assert mock_invoke.call_count == 2
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_extract_json_skips_invalid_brace_spans(self):
+        """Test that raw JSON is found after prose containing stray braces"""
+        command = TaskCheckCommand()
+
+        content = 'Checked {the diff} first. {"deviation_detected": true, "notes": {"x": "}"}} Done.'
+
+        result = command.extract_json_from_response(content)
+        assert result == {"deviation_detected": True, "notes": {"x": "}"}}
+
+    @patch("orchestra.common.claude_cli_wrapper.ClaudeCLIWrapper.invoke")
+    def test_stops_reading_stream_once_json_is_complete(self, mock_invoke):
+        """Test that streamed output is parsed as soon as the JSON object closes"""
+        command = TaskCheckCommand()
+        consumed = []
+
+        def events():
+            for text in ('Looking... {"deviation_detected": true,', ' "deviation_type": "off_topic"}'):
+                consumed.append(text)
+                yield {"type": "assistant", "message": {"content": [{"type": "text", "text": text}]}}
+            consumed.append("never reached")
+            yield {"type": "result", "result": "ignored"}
+
+        mock_invoke.return_value = events()
+
+        result = command.execute(
+            {"transcript": "test", "diff": "diff", "memory": {"task": "test"}}
+        )
+
+        assert result["success"] is True
+        assert result["deviation_type"] == "off_topic"
+        assert "never reached" not in consumed
+        assert mock_invoke.call_args.kwargs["stream"] is True
+
+    @patch("orchestra.common.claude_cli_wrapper.ClaudeCLIWrapper.invoke")
+    def test_streamed_cli_failure_reports_error(self, mock_invoke):
+        """Test that a failing CLI surfaces its error instead of a parse error"""
+        command = TaskCheckCommand()
+        mock_invoke.return_value = iter(
+            [
+                {
+                    "type": "error",
+                    "error": "Claude CLI failed with exit code 1\nStderr: Invalid API key",
+                    "exit_code": 1,
+                }
+            ]
+        )
+
+        result = command.execute(
+            {"transcript": "test", "diff": "diff", "memory": {"task": "test"}}
+        )
+
+        assert result["success"] is False
+        assert "exit code 1" in result["error"]
+        assert "Invalid API key" in result["error"]
+
+    @patch("orchestra.common.claude_cli_wrapper.ClaudeCLIWrapper.invoke")
+    def test_streamed_empty_output_is_failure(self, mock_invoke):
+        """Test that a stream without any text is reported as a failure"""
+        command = TaskCheckCommand()
+        mock_invoke.return_value = iter([{"type": "system", "subtype": "init"}])
+
+        result = command.execute(
+            {"transcript": "test", "diff": "diff", "memory": {"task": "test"}}
+        )
+
+        assert result["success"] is False
+        assert "no output" in result["error"]
@@ -0,0 +1,56 @@
+"""Unit tests for shared task state models"""
+
+from datetime import datetime
+
+import pytest
+
+from orchestra.common.task_state import GitTaskState, TaskRequirement
+
+
+def test_task_requirement_round_trip():
+    """Test that a requirement survives to_dict/from_dict unchanged"""
+    data = {"id": "1", "description": "Fix login", "priority": 2, "completed": True}
+
+    requirement = TaskRequirement.from_dict(data)
+
+    assert requirement == TaskRequirement("1", "Fix login", 2, True)
+    assert requirement.to_dict() == data
+
+
+def test_task_requirement_defaults_to_incomplete():
+    """Test that a missing completed flag loads as incomplete"""
+    requirement = TaskRequirement.from_dict(
+        {"id": "2", "description": "Add tests", "priority": 1}
+    )
+
+    assert requirement.completed is False
+    assert requirement.to_dict()["completed"] is False
+
+
+def test_task_requirement_has_no_instance_dict():
+    """Test that requirements use slots rather than a per-instance dict"""
+    requirement = TaskRequirement("1", "Fix login", 1)
+
+    assert not hasattr(requirement, "__dict__")
+    with pytest.raises(AttributeError):
+        requirement.notes = "unexpected"  # type: ignore[attr-defined]
+
+
+def test_git_task_state_round_trip():
+    """Test that a git task state survives to_dict/from_dict unchanged"""
+    state = GitTaskState(
+        task_id="abc123",
+        task_description="Fix login",
+        base_sha="1111111",
+        current_sha="2222222",
+        branch_name="feature",
+        base_branch="main",
+        created_at=datetime(2024, 1, 2, 3, 4, 5),
+        subagent_branches={"wip_snapshot": "refs/wip/feature"},
+        metadata={"source": "test"},
+    )
+
+    restored = GitTaskState.from_dict(state.to_dict())
+
+    assert restored == state
+    assert restored.to_dict() == state.to_dict()
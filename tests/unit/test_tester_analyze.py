@@ -507,3 +507,31 @@ class TestTesterAnalyzeCommand:
 
         assert len(result["existing_tests_to_update"]) == 2
         assert "test_user.py" in result["existing_tests_to_update"]
+
+    @patch("orchestra.common.claude_cli_wrapper.ClaudeCLIWrapper.invoke")
+    def test_streamed_nested_json_split_across_chunks(self, mock_invoke):
+        """Test that an inner object closing first doesn't end the stream early"""
+        command = TesterAnalyzeCommand()
+        chunks = [
+            '{"tests_needed": [{"file": "a.py", "test_name": "test_a", '
+            '"test_type": "unit", "reason": "new"}',
+            ', {"file": "b.py", "test_name": "test_b", "test_type": "unit", '
+            '"reason": "new"}], "suggested_commands": ["pytest"]',
+            ', "coverage_gaps": [], "existing_tests_to_update": []}',
+        ]
+        mock_invoke.return_value = iter(
+            {"type": "assistant", "message": {"content": [{"type": "text", "text": c}]}}
+            for c in chunks
+        )
+
+        result = command.execute(
+            {
+                "code_changes": {"files": ["a.py", "b.py"], "diff": "+x"},
+                "test_context": {"framework": "pytest"},
+                "calibration_data": {},
+            }
+        )
+
+        assert result["success"] is True
+        assert [t["file"] for t in result["tests_needed"]] == ["a.py", "b.py"]
+        assert result["suggested_commands"] == ["pytest"]